@@ -0,0 +1,8 @@
+import sys
+
+from genetic_vs_swarm.cli import main
+
+
+# Mantido por compatibilidade; equivale a `python -m genetic_vs_swarm bench`
+if __name__ == "__main__":
+    main(['bench', *sys.argv[1:]])
@@ -0,0 +1,51 @@
+"""
+Algoritmo Genético e Otimização por Enxame de Partículas, com as
+ferramentas de varredura de hiperparâmetros e benchmark.
+
+Os submódulos e as classes principais são carregados sob demanda no
+primeiro acesso (genetic_vs_swarm.GeneticAlgorithm, genetic_vs_swarm.tuning,
+...), de modo que importar o pacote não importa o NumPy nem executa nada.
+"""
+import importlib
+
+
+_submodules = (
+    'adaptive_tuning', 'batch_engine', 'benchmark', 'checkpoint', 'cli', 'comparison',
+    'evaluator', 'genetic_alg', 'island_model', 'multi_swarm', 'objectives',
+    'particle_swarm', 'profiling', 'random_streams', 'results_store', 'run_cache',
+    'telemetry', 'termination', 'tuning',
+)
+
+# Nome público -> submódulo que o define
+_exports = {
+    'FunctionEvaluator': 'evaluator',
+    'ConcurrentEvaluator': 'evaluator',
+    'GeneticAlgorithm': 'genetic_alg',
+    'ParticleSwarmOptimization': 'particle_swarm',
+    'AsynchronousParticleSwarmOptimization': 'particle_swarm',
+    'IslandGeneticAlgorithm': 'island_model',
+    'MultiSwarmOptimization': 'multi_swarm',
+    'BatchedGeneticAlgorithm': 'batch_engine',
+    'BatchedParticleSwarm': 'batch_engine',
+    'Objective': 'objectives',
+    'get_objective': 'objectives',
+    'available_objectives': 'objectives',
+    'Termination': 'termination',
+    'ResultsStore': 'results_store',
+}
+
+__all__ = list(_exports) + list(_submodules)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _exports:
+        value = getattr(importlib.import_module(f'.{_exports[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,7 @@
+from .cli import main
+
+
+# A guarda evita reexecutar o comando quando o multiprocessing importa este
+# módulo nos processos workers
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import copy
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from . import batch_engine as be
+from . import random_streams as rs
+from . import run_cache as rc
+from . import tuning as ht
+
+
+# Intervalos [mín, máx] de cada hiperparâmetro; limites inteiros geram sorteios inteiros
+ga_search_space = {
+    'pop_size': (50, 500),
+    'crossover_rate': (0.5, 0.95),
+    'mutation_rate': (0.05, 0.7),
+}
+
+pso_search_space = {
+    'swarm_size': (8, 100),
+    'w': (0.0, 0.9),
+    'c1': (0.5, 2.5),
+    'c2': (0.5, 2.5),
+}
+
+search_spaces = {'GA': ga_search_space, 'PSO': pso_search_space}
+
+# Parâmetro que define o orçamento de cada execução
+budget_params = {'GA': 'generations', 'PSO': 'iterations'}
+
+
+def sample_configs(space, n, rng):
+    """
+    Sorteia `n` configurações uniformemente dentro do espaço de busca.
+    """
+    configs = []
+    for _ in range(n):
+        config = {}
+        for name, (low, high) in space.items():
+            if isinstance(low, int) and isinstance(high, int):
+                config[name] = int(rng.integers(low, high + 1))
+            else:
+                config[name] = round(float(rng.uniform(low, high)), 3)
+        configs.append(config)
+    return configs
+
+
+def _advance(instance, steps, start=False):
+    # Executado no processo worker; a instância volta serializada com o novo estado
+    start_time = time.perf_counter()
+    if start:
+        instance.start()
+    instance.evolve(steps)
+    return instance, time.perf_counter() - start_time
+
+
+def successive_halving(algorithm, n_configs=27, min_budget=4, max_budget=108, eta=3,
+                       repeats=1, seed=None, workers=None, termination=None,
+                       store=None, batched=False):
+    """
+    Busca aleatória com successive halving: `n_configs` configurações
+    sorteadas são executadas com `min_budget` gerações/iterações; apenas a
+    melhor fração 1/eta (pela média de best_fitness entre as `repeats`
+    sementes) avança para a rodada seguinte, com orçamento eta vezes maior,
+    até restar uma configuração ou o orçamento atingir `max_budget`.
+
+    As execuções sobreviventes continuam de onde pararam: cada rodada só
+    avança as gerações/iterações que faltam para o novo orçamento, e o
+    estado de cada uma é o mesmo de uma execução nova com esse orçamento.
+    Com os valores padrão o orçamento total fica abaixo do da grade fixa
+    (ver tuning.grid_evaluations) mesmo com as maiores populações.
+
+    Todas as configurações usam as mesmas sementes em todas as rodadas, de
+    modo que as comparações entre elas são pareadas. As execuções de cada
+    rodada são distribuídas por um pool de processos (com `batched`, avançam
+    juntas no motor em lote). Com um ResultsStore em `store`, o resultado
+    de cada execução ao fim de cada rodada é gravado com sua chave de
+    conteúdo; o banco não é consultado, pois a continuação precisa do
+    estado completo das execuções.
+
+    Retorna um dicionário com a melhor configuração ('best_params'), sua
+    pontuação ('best_score'), o histórico por rodada ('history'), as linhas
+    de cada execução ao fim de cada rodada ('rows') e o total de avaliações
+    da busca ('evaluations').
+    """
+    rng = rs.make_rng(seed)
+    configs = sample_configs(search_spaces[algorithm], n_configs, rng)
+    seeds = rs.spawn_seeds(seed, repeats)
+    budget_param = budget_params[algorithm]
+
+    # Cada execução é criada com o orçamento máximo e avançada rodada a rodada
+    tasks = []
+    for config in configs:
+        params = dict(config, **{budget_param: max_budget})
+        for s in seeds:
+            if termination is not None:
+                # Cada execução precisa do próprio estado da política de parada
+                params = dict(params, termination=copy.deepcopy(termination))
+            tasks.append((algorithm, params, s))
+    elapsed = np.zeros(len(tasks))
+
+    if batched:
+        engine = be.BatchedGeneticAlgorithm if algorithm == 'GA' else be.BatchedParticleSwarm
+        runner = engine(ht.OBJECTIVE, [params for _, params, _ in tasks],
+                        seeds=[s for _, _, s in tasks], bounds=ht.BOUNDS)
+        runner.start()
+        totals = getattr(runner, budget_param)
+        executor = None
+    else:
+        runner = [ht.make_instance(*task) for task in tasks]
+        executor = None if workers == 1 else ProcessPoolExecutor(max_workers=workers)
+
+    alive = np.arange(n_configs)
+    budget = min(min_budget, max_budget)
+    done = 0
+    history = []
+    all_rows = []
+
+    try:
+        while True:
+            runs = (alive[:, None] * repeats + np.arange(repeats)).ravel()
+            steps = budget - done
+
+            if batched:
+                # Execuções descartadas ficam congeladas no ponto em que pararam
+                totals[:] = np.minimum(totals, done)
+                totals[runs] = budget
+                start_time = time.perf_counter()
+                runner.evolve(steps)
+                elapsed[runs] += (time.perf_counter() - start_time) / len(runs)
+                results = runner.results()
+            else:
+                instances = [runner[r] for r in runs]
+                starting = repeat(done == 0)
+                if executor is None:
+                    advanced = list(map(_advance, instances, repeat(steps), starting))
+                else:
+                    advanced = list(executor.map(_advance, instances, repeat(steps), starting))
+                for r, (instance, seconds) in zip(runs, advanced):
+                    runner[r] = instance
+                    elapsed[r] += seconds
+
+            rows = []
+            for r in runs:
+                _, params, s = tasks[r]
+                params = dict(params, **{budget_param: budget})
+                if batched:
+                    row = ht.batch_row(algorithm, params, s, results[r], elapsed[r])
+                else:
+                    row = ht.instance_row(algorithm, params, s, runner[r], elapsed[r])
+                if store is not None:
+                    row['run_key'] = rc.run_key(ht.OBJECTIVE, ht.BOUNDS, algorithm, params, s)
+                rows.append(row)
+            if store is not None:
+                store.add_runs(rows)
+            all_rows += rows
+
+            fitnesses = np.array([row['best_fitness'] for row in rows]).reshape(len(alive), repeats)
+            scores = fitnesses.mean(axis=1)
+            history.append({'budget': budget, 'configs': [configs[c] for c in alive],
+                            'scores': scores.tolist()})
+
+            if budget >= max_budget or len(alive) == 1:
+                break
+
+            keep = max(1, len(alive) // eta)
+            alive = alive[np.sort(np.argsort(scores, kind='stable')[:keep])]
+            done = budget
+            budget = min(max_budget, budget * eta)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if batched:
+        evaluations = sum(result['evaluations'] for result in runner.results())
+    else:
+        evaluations = sum(instance.func_evaluator.evaluations for instance in runner)
+
+    best = int(np.argmin(scores))
+    return {
+        'algorithm': algorithm,
+        'best_params': dict(history[-1]['configs'][best], **{budget_param: budget}),
+        'best_score': float(scores[best]),
+        'history': history,
+        'rows': all_rows,
+        'evaluations': evaluations,
+    }
+
+
+def print_history(result):
+    for rung in result['history']:
+        print(f"  Orçamento {rung['budget']:>4}: {len(rung['configs']):>3} configurações, "
+              f"melhor média {min(rung['scores']):.4f}")
+    print(f"  Melhor configuração: {result['best_params']} "
+          f"(média {result['best_score']:.4f}, {result['evaluations']} avaliações no total)")
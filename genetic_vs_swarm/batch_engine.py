@@ -0,0 +1,395 @@
+import numpy as np
+
+from . import objectives as obj
+from . import random_streams as rs
+
+
+def _resolve_objective(objective):
+    if isinstance(objective, str):
+        return obj.get_objective(objective)
+    return objective
+
+
+def _make_generators(seeds, n_runs):
+    if seeds is None:
+        return rs.spawn_generators(None, n_runs)
+    if len(seeds) != n_runs:
+        raise ValueError(f"São necessárias {n_runs} sementes, uma por execução; "
+                         f"recebidas {len(seeds)}.")
+    return [rs.make_rng(seed) for seed in seeds]
+
+
+def _check_configs(configs, supported):
+    # Chaves fora do conjunto suportado seriam ignoradas pelo motor, embora
+    # façam parte da chave de cache das execuções (ver run_cache.py)
+    for config in configs:
+        unsupported = sorted(set(config) - supported)
+        if unsupported:
+            raise ValueError(f"Parâmetros não suportados pelo motor em lote: "
+                             f"{', '.join(unsupported)} (aceitos: {', '.join(sorted(supported))}).")
+
+
+def _stats(evaluations, ops):
+    # Mesmo formato de FunctionEvaluator.get_stats
+    return {
+        "evaluations": int(evaluations),
+        "multiplications": int(evaluations * ops[0]),
+        "divisions": int(evaluations * ops[1])
+    }
+
+
+class BatchedParticleSwarm:
+    """
+    Executa R enxames independentes do ParticleSwarmOptimization (topologia
+    global) de uma só vez, com estado em arrays (R, n, dim). Cada execução
+    tem seus próprios parâmetros (`configs`, dicionários com swarm_size,
+    iterations, w, c1 e c2) e sua própria semente; enxames menores são
+    completados até o maior tamanho com posições inativas, que não são
+    contabilizadas, e execuções com menos iterações ficam congeladas ao
+    terminar. Apenas as posições válidas das execuções ainda ativas são
+    avaliadas a cada iteração.
+
+    Cada execução sorteia de seu próprio gerador na mesma ordem que o
+    ParticleSwarmOptimization, e as contas são as mesmas, elemento a
+    elemento: com a mesma semente, os resultados são idênticos aos de
+    execuções separadas. Não há política de parada antecipada nem
+    checkpoints (configurações com outras chaves são rejeitadas); as
+    contagens de avaliações e operações de cada execução são calculadas a
+    partir da contagem declarada pela função objetivo.
+    """
+
+    def __init__(self, objective, configs, seeds=None, bounds=None, dim=2):
+        self.objective = _resolve_objective(objective)
+        if bounds is None:
+            bounds = self.objective.bounds
+        self.bounds = bounds
+        self.dim = dim
+        self.lower, self.upper = obj.resolve_bounds(bounds, dim)
+        self.ops = self.objective.op_counts(dim)
+
+        _check_configs(configs, {'swarm_size', 'iterations', 'w', 'c1', 'c2'})
+        self.configs = [dict(config) for config in configs]
+        self.n_runs = len(self.configs)
+        self.rngs = _make_generators(seeds, self.n_runs)
+
+        # Parâmetros por execução, como vetores (R,) ou (R, 1, 1)
+        self.sizes = np.array([c['swarm_size'] for c in self.configs])
+        self.iterations = np.array([c['iterations'] for c in self.configs])
+        self.w = np.array([c['w'] for c in self.configs], dtype=float)[:, None, None]
+        self.c1 = np.array([c['c1'] for c in self.configs], dtype=float)[:, None, None]
+        self.c2 = np.array([c['c2'] for c in self.configs], dtype=float)[:, None, None]
+
+        self.n = int(self.sizes.max())
+        # Posições válidas de cada enxame (R, n)
+        self.slots = np.arange(self.n) < self.sizes[:, None]
+
+    def _initialize_swarms(self):
+        shape = (self.n_runs, self.n, self.dim)
+        # Posições inativas ficam paradas no limite inferior
+        self.particles_pos = np.broadcast_to(self.lower, shape).copy()
+        self.particles_vel = np.zeros(shape)
+
+        for r, (rng, size) in enumerate(zip(self.rngs, self.sizes)):
+            self.particles_pos[r, :size] = rng.uniform(self.lower, self.upper, (size, self.dim))
+            self.particles_vel[r, :size] = rng.uniform(-1, 1, (size, self.dim))
+
+        self.particles_pbest_pos = self.particles_pos.copy()
+        self.particles_pbest_val = np.full((self.n_runs, self.n), float('inf'))
+
+    def start(self):
+        """
+        Prepara os enxames de todas as execuções sem avançar nenhuma iteração.
+        """
+        self.gbest_val = np.full(self.n_runs, float('inf'))
+        self.gbest_pos = np.zeros((self.n_runs, self.dim))
+        self.iteration = 0
+        self.last_improvement_iter = np.zeros(self.n_runs, dtype=int)
+        # Instantes (iteração, avaliações) do melhor global e da convergência
+        self._min_evaluations = np.zeros(self.n_runs, dtype=int)
+        self._min_iteration = np.zeros(self.n_runs, dtype=int)
+        self._convergence_iteration = np.full(self.n_runs, -1)
+
+        self._initialize_swarms()
+        self._r1 = np.zeros((self.n_runs, self.n, self.dim))
+        self._r2 = np.zeros((self.n_runs, self.n, self.dim))
+
+    def is_running(self):
+        return self.iteration < self.iterations
+
+    def run(self):
+        self.start()
+        self.evolve(int(self.iterations.max()))
+        return self
+
+    def evolve(self, iterations):
+        """
+        Avança até `iterations` iterações de todas as execuções ainda ativas.
+        Cada execução para ao atingir seu próprio total em `self.iterations`,
+        que pode ser alterado entre chamadas (por exemplo, para encerrar
+        execuções descartadas pelo successive halving). Retorna True
+        enquanto alguma execução ainda estiver ativa.
+        """
+        runs = np.arange(self.n_runs)
+        r1, r2 = self._r1, self._r2
+
+        for _ in range(iterations):
+            if not self.is_running().any():
+                break
+
+            it = self.iteration
+            running = self.is_running()
+            active = self.slots & running[:, None]
+
+            # 1. Avaliação de todas as partículas ativas em uma única chamada
+            current_vals = np.full((self.n_runs, self.n), float('inf'))
+            current_vals[active] = self.objective.function(self.particles_pos[active])
+
+            # 2. Melhores pessoais
+            improved = current_vals < self.particles_pbest_val
+            self.particles_pbest_val[improved] = current_vals[improved]
+            self.particles_pbest_pos[improved] = self.particles_pos[improved]
+
+            # 3. Melhor global de cada execução
+            best_idx = np.argmin(current_vals, axis=1)
+            best_vals = current_vals[runs, best_idx]
+            better = best_vals < self.gbest_val
+            self.gbest_val[better] = best_vals[better]
+            self.gbest_pos[better] = self.particles_pos[runs, best_idx][better]
+            self._min_evaluations[better] = it * self.sizes[better] + best_idx[better] + 1
+            self._min_iteration[better] = it
+            self.last_improvement_iter[better] = it
+
+            # 4. Velocidades e posições; cada execução sorteia do próprio gerador
+            for r in np.flatnonzero(running):
+                size = self.sizes[r]
+                r1[r, :size] = self.rngs[r].random((size, self.dim))
+                r2[r, :size] = self.rngs[r].random((size, self.dim))
+
+            cognitive_vel = self.c1 * r1 * (self.particles_pbest_pos - self.particles_pos)
+            social_vel = self.c2 * r2 * (self.gbest_pos[:, None, :] - self.particles_pos)
+            new_vel = self.w * self.particles_vel + cognitive_vel + social_vel
+
+            moving = active[:, :, None]
+            np.copyto(self.particles_vel, new_vel, where=moving)
+            np.add(self.particles_pos, self.particles_vel, out=self.particles_pos, where=moving)
+            np.clip(self.particles_pos, self.lower, self.upper, out=self.particles_pos)
+
+            self.iteration += 1
+
+            converged = (running & (it - self.last_improvement_iter > 20) &
+                         (self._convergence_iteration < 0))
+            self._convergence_iteration[converged] = it
+
+        return bool(self.is_running().any())
+
+    def results(self):
+        """
+        Uma entrada por execução, com os mesmos campos de uma instância do
+        ParticleSwarmOptimization após run(): gbest_val, gbest_pos,
+        global_min_info, convergence_info e contadores internos.
+        """
+        results = []
+        for r in range(self.n_runs):
+            size = int(self.sizes[r])
+            # 5 * dim multiplicações por partícula a cada atualização de velocidade
+            mult_per_iter = 5 * self.dim * size
+
+            converged_at = self._convergence_iteration[r]
+            if converged_at < 0:
+                converged_at = self.iterations[r] - 1
+
+            results.append({
+                'gbest_val': float(self.gbest_val[r]),
+                'gbest_pos': self.gbest_pos[r].copy(),
+                'global_min_info': (_stats(self._min_evaluations[r], self.ops),
+                                    int(self._min_iteration[r] * mult_per_iter), 0),
+                'convergence_info': (_stats((converged_at + 1) * size, self.ops),
+                                     int((converged_at + 1) * mult_per_iter), 0),
+                'evaluations': int(self.iterations[r] * size),
+                'internal_multiplications': int(self.iterations[r] * mult_per_iter),
+                'internal_divisions': 0,
+            })
+        return results
+
+
+class BatchedGeneticAlgorithm:
+    """
+    Contraparte do BatchedParticleSwarm para o GeneticAlgorithm (seleção por
+    roleta): R populações independentes evoluem juntas em arrays (R, n, dim),
+    cada uma com seus parâmetros (`configs`, dicionários com pop_size,
+    generations, crossover_rate e mutation_rate) e sua semente. Populações
+    menores são completadas até o maior tamanho com indivíduos inativos,
+    que não são avaliados, selecionados nem contabilizados; as populações
+    de execuções já encerradas também deixam de ser avaliadas.
+
+    Assim como no enxame, os sorteios de cada execução seguem a ordem do
+    GeneticAlgorithm e os resultados coincidem com os de execuções
+    separadas com a mesma semente.
+    """
+
+    def __init__(self, objective, configs, seeds=None, bounds=None, dim=2):
+        self.objective = _resolve_objective(objective)
+        if bounds is None:
+            bounds = self.objective.bounds
+        self.bounds = bounds
+        self.dim = dim
+        self.lower, self.upper = obj.resolve_bounds(bounds, dim)
+        self.ops = self.objective.op_counts(dim)
+
+        _check_configs(configs, {'pop_size', 'generations', 'crossover_rate', 'mutation_rate'})
+        self.configs = [dict(config) for config in configs]
+        self.n_runs = len(self.configs)
+        self.rngs = _make_generators(seeds, self.n_runs)
+
+        self.sizes = np.array([c['pop_size'] for c in self.configs])
+        self.generations = np.array([c['generations'] for c in self.configs])
+        self.crossover_rate = np.array([c['crossover_rate'] for c in self.configs], dtype=float)
+        self.mutation_rate = np.array([c['mutation_rate'] for c in self.configs], dtype=float)
+
+        self.n = int(self.sizes.max())
+        self.slots = np.arange(self.n) < self.sizes[:, None]
+
+    def _initialize_population(self):
+        self.population = np.broadcast_to(
+            self.lower, (self.n_runs, self.n, self.dim)).copy()
+        for r, (rng, size) in enumerate(zip(self.rngs, self.sizes)):
+            self.population[r, :size] = rng.uniform(self.lower, self.upper, (size, self.dim))
+
+    def _info(self, r, generation):
+        return (_stats((generation + 1) * self.sizes[r], self.ops),
+                int(self.internal_multiplications[r]), int(self.internal_divisions[r]))
+
+    def start(self):
+        """
+        Prepara as populações de todas as execuções sem avançar nenhuma geração.
+        """
+        self.best_fitness = np.full(self.n_runs, float('inf'))
+        self.best_solution = np.zeros((self.n_runs, self.dim))
+        self.generation = 0
+        self.last_improvement_gen = np.zeros(self.n_runs, dtype=int)
+
+        self.internal_multiplications = np.zeros(self.n_runs, dtype=np.int64)
+        self.internal_divisions = np.zeros(self.n_runs, dtype=np.int64)
+        self._min_info = [None] * self.n_runs
+        self._convergence_info = [None] * self.n_runs
+
+        self._initialize_population()
+        self._indices = np.zeros((self.n_runs, self.n), dtype=np.intp)
+        self._alpha = np.ones((self.n_runs, self.n // 2, 1))
+        self._mutating = np.zeros((self.n_runs, self.n, self.dim), dtype=bool)
+        self._noise = np.zeros((self.n_runs, self.n, self.dim))
+
+    def is_running(self):
+        return self.generation < self.generations
+
+    def run(self):
+        self.start()
+        self.evolve(int(self.generations.max()))
+        return self
+
+    def evolve(self, generations):
+        """
+        Avança até `generations` gerações de todas as execuções ainda ativas;
+        como no BatchedParticleSwarm.evolve, o total de cada execução em
+        `self.generations` pode ser alterado entre chamadas. Retorna True
+        enquanto alguma execução ainda estiver ativa.
+        """
+        runs = np.arange(self.n_runs)
+        n_pairs = self.n // 2
+        indices, alpha = self._indices, self._alpha
+        mutating, noise = self._mutating, self._noise
+
+        for _ in range(generations):
+            if not self.is_running().any():
+                break
+
+            gen = self.generation
+            running = self.is_running()
+            active = self.slots & running[:, None]
+
+            # 1. Avaliação
+            fitnesses = np.full((self.n_runs, self.n), float('inf'))
+            fitnesses[active] = self.objective.function(self.population[active])
+
+            # 2. Melhor resultado de cada execução
+            best_idx = np.argmin(np.where(active, fitnesses, float('inf')), axis=1)
+            best_vals = fitnesses[runs, best_idx]
+            better = running & (best_vals < self.best_fitness)
+            self.best_fitness[better] = best_vals[better]
+            self.best_solution[better] = self.population[runs, best_idx][better]
+            self.last_improvement_gen[better] = gen
+            for r in np.flatnonzero(better):
+                self._min_info[r] = self._info(r, gen)
+
+            # 3. Pesos da roleta de todas as execuções de uma vez
+            max_fitness = np.max(np.where(active, fitnesses, -float('inf')), axis=1)
+            weights = (max_fitness[:, None] - fitnesses) + 1
+
+            # 4. Seleção, crossover e mutação sorteados do gerador de cada
+            # execução, na ordem do GeneticAlgorithm
+            for r in np.flatnonzero(running):
+                rng, size = self.rngs[r], self.sizes[r]
+                pairs = size // 2
+
+                # A soma percorre apenas os indivíduos válidos, na mesma ordem
+                probabilities = weights[r, :size]
+                total_weight = np.sum(probabilities)
+                if total_weight == 0:
+                    probabilities = np.full(size, 1 / size)
+                else:
+                    probabilities = probabilities / total_weight
+                    self.internal_divisions[r] += size
+                cdf = np.cumsum(probabilities)
+                cdf /= cdf[-1]
+                indices[r, :size] = cdf.searchsorted(rng.random(size), side='right')
+
+                crossing = rng.random(pairs) < self.crossover_rate[r]
+                alpha[r, :pairs] = rng.random((pairs, 1))
+                alpha[r, :pairs][~crossing] = 1.0
+                self.internal_multiplications[r] += 4 * self.dim * int(np.count_nonzero(crossing))
+
+                mutating[r, :size] = rng.random((size, self.dim)) < self.mutation_rate[r]
+                noise[r, :size] = rng.standard_normal((size, self.dim))
+                noise[r, :size] *= 5
+
+            # 5. Crossover e mutação de todas as populações de uma vez
+            parents = np.take_along_axis(self.population, indices[:, :, None], axis=1)
+            parent1 = parents[:, 0:2 * n_pairs:2]
+            parent2 = parents[:, 1:2 * n_pairs:2]
+            children = parents.copy()
+            children[:, 0:2 * n_pairs:2] = alpha * parent1 + (1 - alpha) * parent2
+            children[:, 1:2 * n_pairs:2] = alpha * parent2 + (1 - alpha) * parent1
+
+            np.add(children, noise, out=children, where=mutating & active[:, :, None])
+            np.clip(children, self.lower, self.upper, out=children)
+            np.copyto(self.population, children, where=active[:, :, None])
+
+            self.generation += 1
+
+            for r in np.flatnonzero(running & (gen - self.last_improvement_gen > 20)):
+                if self._convergence_info[r] is None:
+                    self._convergence_info[r] = self._info(r, gen)
+
+        return bool(self.is_running().any())
+
+    def results(self):
+        """
+        Uma entrada por execução, com os mesmos campos de uma instância do
+        GeneticAlgorithm após run(): best_fitness, best_solution,
+        global_min_info, convergence_info e contadores internos.
+        """
+        results = []
+        for r in range(self.n_runs):
+            convergence_info = self._convergence_info[r]
+            if convergence_info is None:
+                convergence_info = self._info(r, self.generations[r] - 1)
+            results.append({
+                'best_fitness': float(self.best_fitness[r]),
+                'best_solution': self.best_solution[r].copy(),
+                'global_min_info': self._min_info[r],
+                'convergence_info': convergence_info,
+                'evaluations': int(self.generations[r] * self.sizes[r]),
+                'internal_multiplications': int(self.internal_multiplications[r]),
+                'internal_divisions': int(self.internal_divisions[r]),
+            })
+        return results
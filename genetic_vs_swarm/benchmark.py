@@ -0,0 +1,125 @@
+import time
+import numpy as np
+
+from . import evaluator as ev
+from . import genetic_alg as ga
+from . import particle_swarm as ps
+from . import random_streams as rs
+
+
+# Configurações usadas pelo comando run (comparison.py)
+default_configs = [
+    ('GA', {'pop_size': 100, 'generations': 200,
+            'crossover_rate': 0.8, 'mutation_rate': 0.2}),
+    ('PSO', {'swarm_size': 100, 'iterations': 200, 'w': 0.5, 'c1': 2.0, 'c2': 2.0}),
+]
+
+summary_percentiles = (5, 25, 75, 95)
+
+
+def run_once(algorithm, params, seed, objective='w22', bounds=None, dim=2, profile=False):
+    """
+    Executa uma repetição e retorna as métricas brutas da execução.
+    Sem `bounds`, usa os limites declarados pela função objetivo. Com
+    `profile`, inclui o tempo (ms) de cada fase do laço principal.
+    """
+    evaluator = ev.FunctionEvaluator(objective_function=objective)
+
+    if algorithm == 'GA':
+        instance = ga.GeneticAlgorithm(
+            func_evaluator=evaluator, bounds=bounds, dim=dim, seed=seed,
+            profile=profile, **params)
+    else:
+        instance = ps.ParticleSwarmOptimization(
+            func_evaluator=evaluator, bounds=bounds, dim=dim, seed=seed,
+            profile=profile, **params)
+
+    start_time = time.perf_counter()
+    instance.run()
+    wall_time = time.perf_counter() - start_time
+
+    best_fitness = instance.best_fitness if algorithm == 'GA' else instance.gbest_val
+    stats_min, mult_min, div_min = instance.global_min_info
+    stats = evaluator.get_stats()
+
+    results = {
+        'wall_time': wall_time,
+        'best_fitness': best_fitness,
+        'evaluations_to_min': stats_min['evaluations'],
+        'ops_to_min': stats_min['multiplications'] + mult_min + stats_min['divisions'] + div_min,
+        'evaluations': stats['evaluations'],
+        'total_ops': (stats['multiplications'] + instance.internal_multiplications +
+                      stats['divisions'] + instance.internal_divisions),
+        'throughput': stats['evaluations'] / wall_time if wall_time > 0 else float('inf'),
+    }
+    for phase, report in instance.get_profile().items():
+        results[f'ms_{phase}'] = report['total_ns'] / 1e6
+    return results
+
+
+def summarize(values):
+    values = np.asarray(values, dtype=float)
+    summary = {
+        'mean': float(np.mean(values)),
+        'std': float(np.std(values)),
+        'median': float(np.median(values)),
+        'min': float(np.min(values)),
+        'max': float(np.max(values)),
+    }
+    for q, value in zip(summary_percentiles, np.percentile(values, summary_percentiles)):
+        summary[f'p{q}'] = float(value)
+    return summary
+
+
+def benchmark(configs=default_configs, runs=10, seed=None, target=None, objective='w22',
+              dim=2, profile=False):
+    """
+    Executa `runs` repetições semeadas de cada configuração sobre a função
+    `objective` do registro, em `dim` dimensões, e retorna uma lista de
+    relatórios, um por configuração, com a estatística de cada métrica, a
+    taxa de sucesso contra `target` e a vazão agregada.
+
+    As sementes de uma mesma repetição são compartilhadas entre as
+    configurações, de modo que as comparações sejam pareadas.
+    """
+    seeds = rs.spawn_seeds(seed, runs)
+    reports = []
+
+    for algorithm, params in configs:
+        results = [run_once(algorithm, params, s, objective, dim=dim, profile=profile)
+                   for s in seeds]
+
+        metrics = {key: summarize([r[key] for r in results])
+                   for key in results[0]}
+
+        total_time = sum(r['wall_time'] for r in results)
+        report = {
+            'algorithm': algorithm,
+            'objective': objective,
+            'dim': dim,
+            'params': params,
+            'runs': runs,
+            'metrics': metrics,
+            'throughput': sum(r['evaluations'] for r in results) / total_time,
+            'success_rate': None,
+        }
+        if target is not None:
+            report['success_rate'] = float(
+                np.mean([r['best_fitness'] <= target for r in results]))
+
+        reports.append(report)
+
+    return reports
+
+
+def print_report(reports):
+    columns = ('mean', 'median', 'std', 'p5', 'p95')
+    for report in reports:
+        print(f"\n--- {report['algorithm']} em {report['objective']} ({report['dim']}D) {report['params']} "
+              f"({report['runs']} execuções) ---")
+        print(f"{'métrica':<20}" + "".join(f"{c:>16}" for c in columns))
+        for name, summary in report['metrics'].items():
+            print(f"{name:<20}" + "".join(f"{summary[c]:>16.4f}" for c in columns))
+        print(f"Vazão: {report['throughput']:.1f} avaliações/s")
+        if report['success_rate'] is not None:
+            print(f"Taxa de sucesso: {100 * report['success_rate']:.1f}%")
@@ -0,0 +1,74 @@
+import json
+import os
+
+import numpy as np
+
+
+def save_checkpoint(path, arrays, meta):
+    """
+    Grava o estado de uma execução em um arquivo .npz compacto: os arrays
+    NumPy são armazenados em binário e os metadados (contadores, estado do
+    gerador aleatório, informações de convergência) como JSON. A escrita
+    passa por um arquivo temporário, de modo que uma interrupção durante a
+    gravação não corrompe o checkpoint anterior.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, _meta=np.array(json.dumps(meta)), **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    """
+    Lê um checkpoint gravado por save_checkpoint e retorna (arrays, meta).
+    """
+    with np.load(path) as data:
+        arrays = {key: data[key] for key in data.files if key != '_meta'}
+        meta = json.loads(str(data['_meta']))
+    return arrays, meta
+
+
+def check_compatible(path, arrays, meta, shapes, params):
+    """
+    Verifica se o checkpoint pode ser retomado pela instância atual: cada
+    array em `shapes` precisa ter a forma esperada e os parâmetros gravados
+    em meta["params"] (ausentes em checkpoints antigos) precisam coincidir
+    com `params`, sem o que a continuação não seria idêntica.
+    """
+    for name, shape in shapes.items():
+        if name in arrays and arrays[name].shape != shape:
+            raise ValueError(f"O checkpoint '{path}' guarda '{name}' com forma "
+                             f"{arrays[name].shape}, mas esta execução espera {shape}.")
+
+    saved = meta.get("params")
+    if saved is None:
+        return
+    different = [f"{key}={saved.get(key)!r} (atual: {value!r})"
+                 for key, value in params.items() if saved.get(key) != value]
+    if different:
+        raise ValueError(f"O checkpoint '{path}' foi salvo com outros parâmetros: "
+                         f"{', '.join(different)}.")
+
+
+def evaluator_state(func_evaluator):
+    return {
+        "evaluations": func_evaluator.evaluations,
+        "multiplications": func_evaluator.multiplications,
+        "divisions": func_evaluator.divisions,
+        "cache_hits": func_evaluator.cache_hits,
+        "cache_misses": func_evaluator.cache_misses,
+    }
+
+
+def restore_evaluator(func_evaluator, state):
+    # O conteúdo do cache não é salvo; apenas os contadores são restaurados
+    for key, value in state.items():
+        setattr(func_evaluator, key, value)
+
+
+def info_to_json(info):
+    return None if info is None else list(info)
+
+
+def info_from_json(info):
+    return None if info is None else tuple(info)
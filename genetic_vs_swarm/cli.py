@@ -0,0 +1,138 @@
+import argparse
+
+
+# Os módulos do pacote (e o NumPy) só são importados depois que o
+# subcomando é escolhido; montar o parser e exibir a ajuda não custa nada.
+
+
+def _check_objective(name, parser):
+    from . import objectives as obj
+
+    if name not in obj.available_objectives():
+        parser.error(f"função objetivo desconhecida: '{name}' "
+                     f"(disponíveis: {', '.join(obj.available_objectives())})")
+    return obj.get_objective(name)
+
+
+def _run(args, parser):
+    from . import comparison
+
+    objective = _check_objective(args.objective, parser)
+    # A comparação exibe as soluções como pares (x, y)
+    if objective.dim is not None and objective.dim != 2:
+        parser.error(f"a função '{objective.name}' tem {objective.dim} dimensões; "
+                     f"'run' aceita apenas funções de 2 dimensões")
+
+    comparison.run_comparison(objective=args.objective)
+
+
+def _tune(args, parser):
+    from . import tuning
+
+    if args.import_csv is not None:
+        tuning.import_csv(args.import_csv)
+        return
+
+    termination = None
+    if any(v is not None for v in (args.stagnation, args.max_evaluations,
+                                   args.time_limit, args.target)):
+        from . import termination as tm
+
+        termination = tm.Termination(
+            stagnation=args.stagnation, max_evaluations=args.max_evaluations,
+            time_limit=args.time_limit, target_fitness=args.target)
+
+    if args.batched and termination is not None:
+        parser.error("--batched não aceita critérios de parada antecipada.")
+
+    tuning.tune(repeats=args.repeats, seed=args.seed, workers=args.workers,
+                termination=termination, adaptive=args.adaptive, batched=args.batched,
+                reuse=not args.no_cache)
+
+
+def _bench(args, parser):
+    from . import benchmark
+
+    objective = _check_objective(args.objective, parser)
+    if args.dim < 1:
+        parser.error(f"--dim deve ser positivo, não {args.dim}")
+    if objective.dim is not None and args.dim != objective.dim:
+        parser.error(f"a função '{objective.name}' aceita apenas {objective.dim} "
+                     f"dimensões, não {args.dim}")
+
+    configs = benchmark.default_configs
+    if args.grid:
+        from . import tuning
+
+        configs = [('GA', p) for p in tuning.ga_param_space] + \
+            [('PSO', p) for p in tuning.pso_param_space]
+
+    benchmark.print_report(benchmark.benchmark(
+        configs, runs=args.runs, seed=args.seed, target=args.target,
+        objective=args.objective, dim=args.dim, profile=args.profile))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='genetic_vs_swarm',
+        description="Comparação entre Algoritmo Genético e Otimização por Enxame de Partículas.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser(
+        'run', help="Executa o GA e o PSO uma vez e compara os resultados.")
+    run.add_argument('--objective', default='w22',
+                     help="Função objetivo do registro (2 dimensões).")
+    run.set_defaults(handler=_run, command_parser=run)
+
+    tune = commands.add_parser(
+        'tune', help="Varredura de hiperparâmetros do GA e do PSO.")
+    tune.add_argument('--workers', type=int, default=None,
+                      help="Número de processos (padrão: todos os núcleos).")
+    tune.add_argument('--repeats', type=int, default=1,
+                      help="Execuções com sementes distintas por configuração.")
+    tune.add_argument('--seed', type=int, default=None,
+                      help="Semente base da varredura.")
+    tune.add_argument('--stagnation', type=int, default=None,
+                      help="Para após N gerações/iterações sem melhora.")
+    tune.add_argument('--max-evaluations', type=int, default=None,
+                      help="Orçamento máximo de avaliações por execução.")
+    tune.add_argument('--time-limit', type=float, default=None,
+                      help="Prazo máximo por execução, em segundos.")
+    tune.add_argument('--target', type=float, default=None,
+                      help="Para ao atingir este valor da função.")
+    tune.add_argument('--adaptive', action='store_true',
+                      help="Usa busca adaptativa (successive halving) em vez da grade fixa.")
+    tune.add_argument('--batched', action='store_true',
+                      help="Executa as configurações de cada algoritmo em um único lote vetorizado "
+                           "(ignora --workers).")
+    tune.add_argument('--no-cache', action='store_true',
+                      help="Reexecuta todas as configurações da grade, sem reaproveitar resultados já registrados.")
+    tune.add_argument('--import-csv', metavar='CSV', default=None,
+                      help="Importa um tuning_results.csv legado para o banco e encerra.")
+    tune.set_defaults(handler=_tune, command_parser=tune)
+
+    bench = commands.add_parser(
+        'bench', help="Benchmark estatístico com repetições semeadas do GA e do PSO.")
+    bench.add_argument('--runs', type=int, default=10,
+                       help="Repetições por configuração.")
+    bench.add_argument('--seed', type=int, default=None,
+                       help="Semente base das repetições.")
+    bench.add_argument('--target', type=float, default=None,
+                       help="Fitness alvo para a taxa de sucesso.")
+    bench.add_argument('--objective', default='w22',
+                       help="Função objetivo do registro.")
+    bench.add_argument('--dim', type=int, default=2,
+                       help="Número de dimensões do espaço de busca.")
+    bench.add_argument('--profile', action='store_true',
+                       help="Inclui o tempo gasto em cada fase do laço principal.")
+    bench.add_argument('--grid', action='store_true',
+                       help="Usa os espaços de parâmetros da varredura de hiperparâmetros.")
+    bench.set_defaults(handler=_bench, command_parser=bench)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.handler(args, args.command_parser)
@@ -0,0 +1,89 @@
+import time
+
+from . import evaluator as ev
+from . import genetic_alg as ga
+from . import particle_swarm as ps
+
+
+def _print_operations(label, stats, mult_int, div_int):
+    print(f"  - Avaliações da Função: {stats['evaluations']}")
+    print(f"  - Operações na Função: {stats['multiplications']} mult, "
+          f"{stats['divisions']} div")
+    print(f"  - Operações Internas {label}: {mult_int} mult, {div_int} div")
+    print(f"  - TOTAIS: {stats['multiplications'] + mult_int} mult, "
+          f"{stats['divisions'] + div_int} div")
+
+
+def _print_analysis(label, convergence_info, global_min_info):
+    print("\nAnálise Computacional")
+    print("a) Convergência alcançada com:")
+    _print_operations(label, *convergence_info)
+
+    print("\nb) Mínimo global encontrado com:")
+    _print_operations(label, *global_min_info)
+
+
+def _total_ops(info):
+    stats, mult_int, div_int = info
+    return stats['multiplications'] + mult_int + stats['divisions'] + div_int
+
+
+def run_comparison(objective='w22', bounds=None):
+    """
+    Executa o GA e o PSO com as configurações de referência sobre a mesma
+    função objetivo e compara a qualidade da solução e o custo em operações.
+    Sem `bounds`, usa os limites declarados pela função objetivo.
+    """
+    evaluator = ev.FunctionEvaluator(objective_function=objective)
+
+    print("--- Iniciando Algoritmo Genético ---")
+    evaluator.reset()
+    genetic = ga.GeneticAlgorithm(
+        func_evaluator=evaluator, bounds=bounds, pop_size=100, generations=200,
+        crossover_rate=0.8, mutation_rate=0.2
+    )
+    start_time = time.perf_counter()
+    genetic.run()
+    ga_time = time.perf_counter() - start_time
+
+    print("\nResultados do Algoritmo Genético")
+    print(f"Tempo de execução: {ga_time:.4f} segundos")
+    print(f"Melhor solução (x, y): "
+          f"({genetic.best_solution[0]:.4f}, {genetic.best_solution[1]:.4f})")
+    print(f"Valor mínimo da função: {genetic.best_fitness:.4f}")
+    _print_analysis("GA", genetic.convergence_info, genetic.global_min_info)
+
+    print("\n\n--- Iniciando Otimização por Enxame de Partículas ---")
+    evaluator.reset()
+    pso = ps.ParticleSwarmOptimization(
+        func_evaluator=evaluator, bounds=bounds, swarm_size=100, iterations=200,
+        w=0.5, c1=2.0, c2=2.0
+    )
+    start_time = time.perf_counter()
+    pso.run()
+    pso_time = time.perf_counter() - start_time
+
+    print("\nResultados da Otimização por Enxame de Partículas")
+    print(f"Tempo de execução: {pso_time:.4f} segundos")
+    print(f"Melhor solução (x, y): ({pso.gbest_pos[0]:.4f}, {pso.gbest_pos[1]:.4f})")
+    print(f"Valor mínimo da função: {pso.gbest_val:.4f}")
+    _print_analysis("PSO", pso.convergence_info, pso.global_min_info)
+
+    print("\n\n--- Comparação Final de Desempenho ---\n")
+    ga_total_ops = _total_ops(genetic.global_min_info)
+    pso_total_ops = _total_ops(pso.global_min_info)
+
+    print(f"Operações totais para encontrar o mínimo (Algoritmo Genético): {ga_total_ops}")
+    print(f"Operações totais para encontrar o mínimo (Enxame de Partículas): {pso_total_ops}")
+
+    if pso.gbest_val < genetic.best_fitness:
+        print("\nO PSO encontrou um valor mínimo melhor.\n")
+    else:
+        print("\nO GA encontrou um valor mínimo melhor.\n")
+
+    if pso_total_ops < ga_total_ops:
+        print("Considerando o número total de operações, o PSO apresentou melhor desempenho computacional.")
+    else:
+        print("Considerando o número total de operações, o GA apresentou melhor desempenho computacional.")
+
+    return genetic, pso
@@ -0,0 +1,362 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import objectives as obj
+
+
+class FunctionEvaluator:
+    """
+    Esta classe monitora as chamadas para a função objetivo, contando
+    o número de avaliações e as operações de multiplicação/divisão.
+
+    A função objetivo pode ser o nome de uma função do registro
+    (objectives.py), um objectives.Objective ou uma função f(x, y, ...) que
+    recebe uma coordenada por argumento. Funções do registro declaram a
+    própria contagem de operações, que depende da dimensão dos pontos; para
+    uma função avulsa, a contagem por chamada deve ser informada em
+    `multiplications` e/ou `divisions` (a omitida vale 0). Uma função
+    avulsa é avaliada ponto a ponto em evaluate_batch, a menos que se
+    forneça `vectorized_function`, que recebe um array por coordenada, e
+    não declara limites: os otimizadores exigem `bounds` explícitos.
+
+    Opcionalmente mantém um cache LRU de até `cache_size` pontos. Com
+    `cache_decimals` as coordenadas são arredondadas antes de formar a
+    chave, de modo que pontos quase idênticos compartilham o valor do
+    primeiro avaliado. `count_cache_hits` define se um acerto no cache
+    conta como avaliação (mantendo os contadores iguais aos de uma
+    execução sem cache) ou se é gratuito.
+    """
+
+    def __init__(self, objective_function, vectorized_function=None,
+                 multiplications=None, divisions=None,
+                 cache_size=None, cache_decimals=None, count_cache_hits=True):
+        if isinstance(objective_function, str):
+            objective_function = obj.get_objective(objective_function)
+
+        self.objective = None
+        if isinstance(objective_function, obj.Objective):
+            self.objective = objective_function
+        elif multiplications is None and divisions is None:
+            # Sem contagem explícita, todos os totais de operações sairiam zerados
+            raise ValueError("Informe multiplications e/ou divisions por chamada para uma "
+                             "função objetivo avulsa (por exemplo, multiplications=3 para "
+                             "a w22) ou use uma função do registro pelo nome.")
+
+        self.objective_function = objective_function
+        # Versão vetorizada usada por evaluate_batch. Se omitida, uma função
+        # avulsa é chamada ponto a ponto, pois pode aceitar apenas escalares.
+        self.vectorized_function = vectorized_function
+        self.multiplications_per_call = multiplications or 0
+        self.divisions_per_call = divisions or 0
+
+        self.cache_size = cache_size
+        self.cache_decimals = cache_decimals
+        self.count_cache_hits = count_cache_hits
+        self._cache = OrderedDict()
+
+        self.reset()
+
+    def _op_counts(self, dim):
+        if self.objective is None:
+            return self.multiplications_per_call, self.divisions_per_call
+
+        if self.objective.dim is not None and dim != self.objective.dim:
+            raise ValueError(f"A função '{self.objective.name}' aceita apenas "
+                             f"{self.objective.dim} dimensões, não {dim}.")
+        return self.objective.op_counts(dim)
+
+    def _count(self, n, ops):
+        self.evaluations += n
+        self.multiplications += ops[0] * n
+        self.divisions += ops[1] * n
+
+    def _compute_batch(self, points):
+        if self.objective is not None:
+            values = self.objective.function(points)
+        elif self.vectorized_function is not None:
+            values = self.vectorized_function(*points.T)
+        else:
+            return np.fromiter((self.objective_function(*p) for p in points.tolist()),
+                               dtype=float, count=len(points))
+        return np.asarray(values, dtype=float)
+
+    def _cache_keys(self, points):
+        if self.cache_decimals is not None:
+            points = np.round(points, self.cache_decimals)
+        return [tuple(p) for p in points.tolist()]
+
+    def _cache_store(self, key, value):
+        self._cache[key] = value
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def evaluate(self, *coords):
+        """
+        Calcula a função e incrementa os contadores. Aceita as coordenadas
+        como argumentos, evaluate(x, y), ou um único vetor, evaluate(point).
+        """
+        if len(coords) == 1:
+            coords = np.asarray(coords[0], dtype=float).ravel()
+        ops = self._op_counts(len(coords))
+
+        if not self.cache_size:
+            self._count(1, ops)
+            return self.objective_function(*coords)
+
+        key = self._cache_keys(np.array([coords], dtype=float))[0]
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            if self.count_cache_hits:
+                self._count(1, ops)
+            return self._cache[key]
+
+        self.cache_misses += 1
+        self._count(1, ops)
+        value = self.objective_function(*coords)
+        self._cache_store(key, value)
+        return value
+
+    def evaluate_batch(self, points):
+        """
+        Avalia uma população inteira (array N x dim) com uma única chamada
+        vetorizada. Os contadores terminam idênticos aos de N chamadas
+        a evaluate.
+        """
+        points = np.asarray(points, dtype=float)
+        self._batch_origin = self.get_stats()
+        self._batch_ops = self._op_counts(points.shape[1])
+
+        if not self.cache_size:
+            self._batch_counted = None
+            self._count(len(points), self._batch_ops)
+            return self._compute_batch(points)
+
+        values = np.empty(len(points))
+        counted = np.ones(len(points), dtype=bool)
+        miss_rows = []
+        pending = {}      # chave -> posição em miss_rows
+        duplicates = []   # (linha, posição em miss_rows) repetidas no próprio lote
+
+        for i, key in enumerate(self._cache_keys(points)):
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                values[i] = self._cache[key]
+            elif key in pending:
+                duplicates.append((i, pending[key]))
+            else:
+                pending[key] = len(miss_rows)
+                miss_rows.append(i)
+                continue
+            counted[i] = self.count_cache_hits
+
+        self.cache_misses += len(miss_rows)
+        self.cache_hits += len(points) - len(miss_rows)
+
+        if miss_rows:
+            miss_values = self._compute_batch(points[miss_rows])
+            values[miss_rows] = miss_values
+            for key, j in pending.items():
+                self._cache_store(key, float(miss_values[j]))
+            for i, j in duplicates:
+                values[i] = miss_values[j]
+
+        self._batch_counted = np.cumsum(counted)
+        self._count(int(self._batch_counted[-1]) if len(points) else 0, self._batch_ops)
+        return values
+
+    def get_batch_stats(self, count):
+        """
+        Retorna as estatísticas como se apenas os `count` primeiros pontos
+        do último lote tivessem sido avaliados, reproduzindo o instante
+        exato que o laço escalar observaria.
+        """
+        if self._batch_counted is not None and count > 0:
+            count = int(self._batch_counted[count - 1])
+        return {
+            "evaluations": self._batch_origin["evaluations"] + count,
+            "multiplications": self._batch_origin["multiplications"] + self._batch_ops[0] * count,
+            "divisions": self._batch_origin["divisions"] + self._batch_ops[1] * count
+        }
+
+    def default_bounds(self):
+        """
+        Limites declarados pela função objetivo do registro, usados pelos
+        otimizadores quando `bounds` não é informado.
+        """
+        if self.objective is None:
+            raise ValueError("Informe bounds: uma função objetivo avulsa não declara "
+                             "limites de busca.")
+        return self.objective.bounds
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def reset(self):
+        # O conteúdo do cache continua válido entre execuções; apenas os
+        # contadores são zerados.
+        self.evaluations = 0
+        self.multiplications = 0
+        self.divisions = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._batch_origin = self.get_stats()
+        self._batch_ops = (0, 0)
+        self._batch_counted = None
+
+    def get_stats(self):
+        return {
+            "evaluations": self.evaluations,
+            "multiplications": self.multiplications,
+            "divisions": self.divisions
+        }
+
+    def get_cache_stats(self):
+        return {
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_entries": len(self._cache),
+            "cache_size": self.cache_size
+        }
+
+
+class ConcurrentEvaluator(FunctionEvaluator):
+    """
+    Avaliador para funções objetivo caras e externas (simulações,
+    subprocessos, chamadas a serviços locais). Em vez de uma chamada
+    vetorizada, evaluate_batch submete cada ponto do lote a um executor com
+    no máximo `max_workers` avaliações simultâneas e reúne os resultados na
+    ordem original; os contadores são os mesmos do FunctionEvaluator.
+
+    A função objetivo pode ser síncrona, f(x, y, ...), executada em um
+    ThreadPoolExecutor próprio (ou no `executor` fornecido, por exemplo um
+    ProcessPoolExecutor), ou uma corrotina, async def f(x, y, ...),
+    executada com asyncio limitada por um semáforo.
+
+    submit/collect permitem consumir avaliações individuais à medida que
+    terminam, como no AsynchronousParticleSwarmOptimization. Corrotinas
+    submetidas dessa forma rodam em um laço de eventos próprio, em uma
+    thread dedicada, com o mesmo limite de `max_workers`.
+    """
+
+    def __init__(self, objective_function, max_workers=8, executor=None, **kwargs):
+        super().__init__(objective_function, **kwargs)
+        self.max_workers = max_workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        # Laço de eventos (e sua thread) usado por submit com corrotinas
+        self._loop = None
+        self._loop_thread = None
+        self._loop_semaphore = None
+
+    def __getstate__(self):
+        # Executores e laços não são serializáveis; cada cópia cria os seus sob demanda
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        state['_owns_executor'] = True
+        state['_loop'] = None
+        state['_loop_thread'] = None
+        state['_loop_semaphore'] = None
+        return state
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _get_loop(self):
+        import asyncio
+        import threading
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_semaphore = asyncio.Semaphore(self.max_workers)
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+            self._loop_thread.start()
+        return self._loop
+
+    async def _evaluate_limited(self, point):
+        async with self._loop_semaphore:
+            return await self.objective_function(*point)
+
+    def _compute_point(self, point):
+        return self.objective_function(*point)
+
+    async def _gather(self, points):
+        import asyncio
+        import inspect
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+        is_coroutine = inspect.iscoroutinefunction(self.objective_function)
+        loop = asyncio.get_running_loop()
+
+        async def evaluate_one(point):
+            async with semaphore:
+                if is_coroutine:
+                    return await self.objective_function(*point)
+                return await loop.run_in_executor(
+                    self._get_executor(), self._compute_point, point)
+
+        values = await asyncio.gather(*(evaluate_one(p) for p in points))
+        return np.asarray(values, dtype=float)
+
+    def _compute_batch(self, points):
+        # asyncio é importado sob demanda: só é necessário para corrotinas
+        import asyncio
+        import inspect
+
+        if inspect.iscoroutinefunction(self.objective_function):
+            return asyncio.run(self._gather(points))
+
+        # executor.map preserva a ordem de submissão
+        values = self._get_executor().map(self._compute_point, points)
+        return np.fromiter(values, dtype=float, count=len(points))
+
+    async def evaluate_batch_async(self, points):
+        """
+        Versão de evaluate_batch para uso dentro de um laço asyncio já em
+        execução. Não consulta o cache.
+        """
+        points = np.asarray(points, dtype=float)
+        self._batch_origin = self.get_stats()
+        self._batch_ops = self._op_counts(points.shape[1])
+        self._batch_counted = None
+        self._count(len(points), self._batch_ops)
+        return await self._gather(points)
+
+    def submit(self, point):
+        """
+        Submete a avaliação de um único ponto e retorna um Future. A
+        avaliação só é contabilizada quando o resultado é lido com collect.
+        """
+        import asyncio
+        import inspect
+
+        point = np.asarray(point, dtype=float).ravel()
+        if inspect.iscoroutinefunction(self.objective_function):
+            future = asyncio.run_coroutine_threadsafe(
+                self._evaluate_limited(point), self._get_loop())
+        else:
+            future = self._get_executor().submit(self._compute_point, point)
+        future.dim = len(point)
+        return future
+
+    def collect(self, future):
+        value = future.result()
+        self._count(1, self._op_counts(future.dim))
+        return value
+
+    def close(self):
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown()
+        self._executor = None
+
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+        self._loop = None
+        self._loop_thread = None
+        self._loop_semaphore = None
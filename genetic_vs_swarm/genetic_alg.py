@@ -0,0 +1,433 @@
+import time
+
+import numpy as np
+
+from . import checkpoint as cp
+from . import evaluator as ev
+from . import objectives as obj
+from . import profiling as pf
+from . import random_streams as rs
+from . import telemetry as tl
+
+
+class GeneticAlgorithm:
+    def __init__(self, func_evaluator, bounds=None, pop_size=50, generations=100,
+                 crossover_rate=0.8, mutation_rate=0.1, dim=2, seed=None, termination=None,
+                 checkpoint_path=None, checkpoint_every=None, resume_from=None,
+                 telemetry=None, profile=False, selection='roulette', tournament_size=3):
+        # Aceita também o nome de uma função do registro (objectives.py)
+        if isinstance(func_evaluator, str):
+            func_evaluator = ev.FunctionEvaluator(func_evaluator)
+        self.func_evaluator = func_evaluator
+        # Sem limites explícitos, usa os declarados pela função objetivo
+        if bounds is None:
+            bounds = func_evaluator.default_bounds()
+        self.bounds = bounds
+        self.dim = dim
+        # Limites por dimensão, arrays (dim,)
+        self.lower, self.upper = obj.resolve_bounds(bounds, dim)
+        self.pop_size = pop_size
+        self.generations = generations
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        # Operador de seleção: 'roulette', 'tournament', 'sus' (amostragem
+        # estocástica universal) ou 'rank' (roleta sobre a posição no ranking)
+        if selection not in ('roulette', 'tournament', 'sus', 'rank'):
+            raise ValueError(f"Operador de seleção desconhecido: '{selection}'.")
+        self.selection = selection
+        self.tournament_size = tournament_size
+        # Todos os sorteios usam este gerador (semente, SeedSequence ou Generator)
+        self.rng = rs.make_rng(seed)
+        # Política de parada antecipada opcional (termination.Termination)
+        self.termination = termination
+        # Checkpoint a cada `checkpoint_every` gerações em `checkpoint_path`;
+        # `resume_from` retoma uma execução a partir de um checkpoint salvo
+        if (checkpoint_path is None) != (not checkpoint_every):
+            raise ValueError("checkpoint_path e checkpoint_every devem ser informados juntos.")
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.resume_from = resume_from
+        # Sink opcional que recebe um registro (telemetry.telemetry_dtype) por geração
+        self.telemetry = telemetry
+        # Instrumentação opcional do tempo gasto em cada fase da geração
+        self.profiler = pf.PhaseProfiler() if profile else None
+
+        # População contígua (pop_size x dim) em float64. A geração seguinte
+        # é escrita em `_offspring` e os dois buffers trocam de papel ao fim de
+        # cada geração; os demais buffers de trabalho são alocados uma única
+        # vez em _allocate_buffers
+        self.population = None
+        self._offspring = None
+        self.best_solution = None
+        self.best_fitness = float('inf')
+        self.convergence_info = None
+        self.global_min_info = None
+        self.stop_reason = None
+        self.generation = 0
+        self.last_improvement_gen = 0
+
+        self.internal_multiplications = 0
+        self.internal_divisions = 0
+        self._start_ns = 0
+
+    def _initialize_population(self):
+        self.population = self.rng.uniform(
+            self.lower, self.upper, (self.pop_size, self.dim)
+        )
+
+    def _allocate_buffers(self):
+        n, dim = self.pop_size, self.dim
+        n_pairs = n // 2
+
+        self._offspring = np.empty((n, dim))
+        # Seleção
+        self._weights = np.empty(n)
+        self._cdf = np.empty(n)
+        self._uniform = np.empty(n)
+        # Crossover
+        self._pair_uniform = np.empty(n_pairs)
+        self._keep = np.empty(n_pairs, dtype=bool)
+        self._alpha = np.empty((n_pairs, 1))
+        self._beta = np.empty((n_pairs, 1))
+        self._child = np.empty((n_pairs, dim))
+        self._term = np.empty((n_pairs, dim))
+        # Mutação
+        self._gene_uniform = np.empty((n, dim))
+        self._mutating = np.empty((n, dim), dtype=bool)
+        self._noise = np.empty((n, dim))
+
+        if self.selection == 'tournament':
+            k = self.tournament_size
+            self._contest_uniform = np.empty((n, k))
+            self._contestants = np.empty((n, k), dtype=np.intp)
+            self._contest_fitness = np.empty((n, k))
+            self._winners = np.empty(n, dtype=np.intp)
+            self._row_offsets = np.arange(n, dtype=np.intp) * k
+        elif self.selection == 'sus':
+            self._pointers = np.empty(n)
+            self._steps = np.arange(n, dtype=float)
+        elif self.selection == 'rank':
+            # Posição no ranking: o melhor indivíduo recebe peso n, o pior 1
+            self._ranks = np.arange(n, 0, -1, dtype=float)
+
+    def _evaluate_population(self):
+        return self.func_evaluator.evaluate_batch(self.population)
+
+    def _inverted_weights(self, fitnesses):
+        # Minimização: peso = (pior fitness - fitness) + 1
+        weights = self._weights
+        np.subtract(np.max(fitnesses), fitnesses, out=weights)
+        weights += 1
+        return weights
+
+    def _roulette_indices(self, weights):
+        # Mesmo procedimento (e mesma sequência de sorteios) de
+        # rng.choice(p=weights / total), sem as cópias intermediárias
+        total_weight = np.sum(weights)
+        if total_weight == 0:
+            weights.fill(1 / self.pop_size)
+        else:
+            np.divide(weights, total_weight, out=weights)
+            self.internal_divisions += self.pop_size
+
+        cdf = np.cumsum(weights, out=self._cdf)
+        cdf /= cdf[-1]
+        return cdf.searchsorted(self.rng.random(self.pop_size, out=self._uniform), side='right')
+
+    def _tournament_indices(self, fitnesses):
+        # Cada vaga é disputada por `tournament_size` indivíduos sorteados
+        # com reposição; vence o de menor fitness
+        contestants = self._contestants
+        uniform = self.rng.random(out=self._contest_uniform)
+        uniform *= self.pop_size
+        np.copyto(contestants, uniform, casting='unsafe')
+        np.minimum(contestants, self.pop_size - 1, out=contestants)
+
+        np.take(fitnesses, contestants, out=self._contest_fitness)
+        winners = np.argmin(self._contest_fitness, axis=1, out=self._winners)
+        winners += self._row_offsets
+        return np.take(contestants.ravel(), winners, out=winners)
+
+    def _sus_indices(self, weights):
+        # Amostragem estocástica universal: pop_size ponteiros igualmente
+        # espaçados sobre a roleta, com um único sorteio de deslocamento
+        cdf = np.cumsum(weights, out=self._cdf)
+        step = cdf[-1] / self.pop_size
+        pointers = np.multiply(self._steps, step, out=self._pointers)
+        pointers += self.rng.random() * step
+        self.internal_multiplications += self.pop_size + 1
+        self.internal_divisions += 1
+
+        indices = cdf.searchsorted(pointers, side='right')
+        np.minimum(indices, self.pop_size - 1, out=indices)
+        # Os ponteiros saem ordenados; embaralha para não cruzar vizinhos de roleta
+        self.rng.shuffle(indices)
+        return indices
+
+    def _rank_weights(self, fitnesses):
+        weights = self._weights
+        np.put(weights, np.argsort(fitnesses, kind='stable'), self._ranks)
+        return weights
+
+    def _selection(self, fitnesses):
+        """
+        Retorna os índices dos pais selecionados na população atual.
+        """
+        if self.selection == 'tournament':
+            return self._tournament_indices(fitnesses)
+        if self.selection == 'sus':
+            return self._sus_indices(self._inverted_weights(fitnesses))
+        if self.selection == 'rank':
+            return self._roulette_indices(self._rank_weights(fitnesses))
+        return self._roulette_indices(self._inverted_weights(fitnesses))
+
+    def _crossover(self, parents):
+        # Pais emparelhados em sequência: (0, 1), (2, 3), ...; os filhos
+        # substituem os pais no próprio buffer
+        n_pairs = self.pop_size // 2
+        parent1 = parents[0:2 * n_pairs:2]
+        parent2 = parents[1:2 * n_pairs:2]
+
+        self.rng.random(n_pairs, out=self._pair_uniform)
+        keep = np.greater_equal(self._pair_uniform, self.crossover_rate, out=self._keep)
+        alpha = self.rng.random(out=self._alpha)
+        alpha[keep] = 1.0  # alpha = 1 mantém os filhos iguais aos pais
+        beta = np.subtract(1, alpha, out=self._beta)
+
+        # CONTANDO AS MULTIPLICAÇÕES NO CROSSOVER
+        # Para child1: alpha * p1[i] e (1-a) * p2[i] em cada dimensão -> 2 * dim mult.
+        # Para child2: alpha * p2[i] e (1-a) * p1[i] em cada dimensão -> 2 * dim mult.
+        # Total: 4 * dim multiplicações (8 em 2D) por par que efetivamente cruza.
+        self.internal_multiplications += 4 * self.dim * (n_pairs - int(np.count_nonzero(keep)))
+
+        # child1 = alpha * p1 + (1 - alpha) * p2
+        child1 = np.multiply(alpha, parent1, out=self._child)
+        child1 += np.multiply(beta, parent2, out=self._term)
+        # child2 = alpha * p2 + (1 - alpha) * p1
+        np.multiply(beta, parent1, out=self._term)
+        parent2 *= alpha
+        parent2 += self._term
+        parent1[...] = child1
+        return parents
+
+    def _mutate(self, population):
+        mutating = np.less(self.rng.random(out=self._gene_uniform), self.mutation_rate,
+                           out=self._mutating)
+
+        # Adiciona ruído gaussiano (desvio padrão de 5) aos genes sorteados
+        noise = self.rng.standard_normal(out=self._noise)
+        noise *= 5
+        np.add(population, noise, out=population, where=mutating)
+
+        return population
+
+    def _clip(self, population):
+        # Garante que os indivíduos permaneçam dentro dos limites
+        np.clip(population, self.lower, self.upper, out=population)
+
+        return population
+
+    def start(self):
+        """
+        Prepara uma nova execução (população inicial, contadores e política
+        de parada) sem avançar nenhuma geração.
+        """
+        self.internal_multiplications = 0
+        self.internal_divisions = 0
+        self._start_ns = time.perf_counter_ns()
+        if self.profiler is not None:
+            self.profiler.reset()
+
+        self.stop_reason = None
+        self.generation = 0
+        self.last_improvement_gen = 0
+        # Nada da execução anterior é aproveitado
+        self.best_solution = None
+        self.best_fitness = float('inf')
+        self.convergence_info = None
+        self.global_min_info = None
+
+        self._initialize_population()
+        self._allocate_buffers()
+        if self.termination is not None:
+            self.termination.start(self.func_evaluator)
+            # O orçamento também vale para a primeira geração/iteração
+            self.stop_reason = self.termination.check_budget(self.func_evaluator, self.pop_size)
+
+    def is_running(self):
+        return self.generation < self.generations and self.stop_reason is None
+
+    def evolve(self, generations):
+        """
+        Avança até `generations` gerações a partir do estado atual, limitado
+        ao total configurado e à política de parada. Permite executar a
+        evolução em etapas (por exemplo, entre migrações do modelo de ilhas).
+        Retorna True enquanto ainda houver gerações a executar.
+        """
+        prof = self.profiler
+
+        for _ in range(generations):
+            if not self.is_running():
+                break
+
+            gen = self.generation
+            if prof is not None:
+                t = time.perf_counter_ns()
+
+            # 1. Avaliação
+            fitnesses = self._evaluate_population()
+            if prof is not None:
+                t = prof.lap('evaluation', t)
+
+            # 2. Rastreamento do melhor resultado
+            current_best_idx = np.argmin(fitnesses)
+
+            if fitnesses[current_best_idx] < self.best_fitness:
+                self.best_fitness = float(fitnesses[current_best_idx])
+                self.best_solution = self.population[current_best_idx].copy()
+                self.global_min_info = (self.func_evaluator.get_stats(),
+                                        self.internal_multiplications, self.internal_divisions)
+                self.last_improvement_gen = gen
+
+            if self.telemetry is not None:
+                self.telemetry(tl.make_record(
+                    gen, fitnesses, self.best_fitness, self.population,
+                    self.func_evaluator.evaluations, time.perf_counter_ns() - self._start_ns))
+            if prof is not None:
+                t = prof.lap('tracking', t)
+
+            # 3. Seleção: os pais são copiados para o buffer da próxima geração
+            parents = np.take(self.population, self._selection(fitnesses), axis=0,
+                              out=self._offspring)
+            if prof is not None:
+                t = prof.lap('selection', t)
+
+            # 4. Crossover e Mutação, no próprio buffer
+            children = self._crossover(parents)
+            if prof is not None:
+                t = prof.lap('crossover', t)
+            children = self._mutate(children)
+            if prof is not None:
+                t = prof.lap('mutation', t)
+            self._offspring = self.population
+            self.population = self._clip(children)
+            if prof is not None:
+                prof.lap('clipping', t)
+
+            self.generation += 1
+
+            # Critério de convergência: se não houver melhora por 20 gerações
+            if gen - self.last_improvement_gen > 20 and self.convergence_info is None:
+                self.convergence_info = (self.func_evaluator.get_stats(),
+                                         self.internal_multiplications,
+                                         self.internal_divisions)
+
+            if self.termination is not None:
+                self.stop_reason = self.termination.check(
+                    gen, self.last_improvement_gen, self.best_fitness,
+                    self.func_evaluator, self.pop_size)
+
+        return self.is_running()
+
+    def get_profile(self):
+        """
+        Relatório por fase (evaluation, tracking, selection, crossover,
+        mutation, clipping) com chamadas e tempo em ns; vazio se a execução
+        não foi instrumentada com profile=True.
+        """
+        return self.profiler.report() if self.profiler is not None else {}
+
+    def _checkpoint_params(self):
+        # Parâmetros que precisam coincidir para retomar um checkpoint
+        return {
+            "pop_size": self.pop_size,
+            "dim": self.dim,
+            "lower": self.lower.tolist(),
+            "upper": self.upper.tolist(),
+            "crossover_rate": self.crossover_rate,
+            "mutation_rate": self.mutation_rate,
+            "selection": self.selection,
+            "tournament_size": self.tournament_size,
+        }
+
+    def save_checkpoint(self, path):
+        """
+        Salva todo o estado necessário para continuar a execução de forma
+        idêntica: população, melhor solução, contadores, informações de
+        convergência e o estado do gerador aleatório.
+        """
+        arrays = {"population": self.population}
+        if self.best_solution is not None:
+            arrays["best_solution"] = self.best_solution
+
+        meta = {
+            "algorithm": "GA",
+            "params": self._checkpoint_params(),
+            "generation": self.generation,
+            "elapsed_ns": time.perf_counter_ns() - self._start_ns,
+            "last_improvement_gen": self.last_improvement_gen,
+            "best_fitness": self.best_fitness,
+            "convergence_info": cp.info_to_json(self.convergence_info),
+            "global_min_info": cp.info_to_json(self.global_min_info),
+            "stop_reason": self.stop_reason,
+            "internal_multiplications": self.internal_multiplications,
+            "internal_divisions": self.internal_divisions,
+            "evaluator": cp.evaluator_state(self.func_evaluator),
+            "rng_state": self.rng.bit_generator.state,
+        }
+        if self.termination is not None:
+            meta["termination_start_evaluations"] = self.termination._start_evaluations
+
+        cp.save_checkpoint(path, arrays, meta)
+
+    def load_checkpoint(self, path):
+        """
+        Restaura o estado salvo por save_checkpoint; checkpoints com outro
+        tamanho, dimensão ou parâmetros são rejeitados. O prazo de relógio da
+        política de parada, se houver, recomeça a contar na retomada.
+        """
+        arrays, meta = cp.load_checkpoint(path)
+        if meta["algorithm"] != "GA":
+            raise ValueError(f"O checkpoint '{path}' não é de um GeneticAlgorithm.")
+        cp.check_compatible(path, arrays, meta,
+                            {"population": (self.pop_size, self.dim),
+                             "best_solution": (self.dim,)},
+                            self._checkpoint_params())
+
+        self._allocate_buffers()
+        self.population = np.ascontiguousarray(arrays["population"], dtype=float)
+        self.best_solution = arrays.get("best_solution")
+        self.best_fitness = meta["best_fitness"]
+        self.generation = meta["generation"]
+        self._start_ns = time.perf_counter_ns() - meta["elapsed_ns"]
+        self.last_improvement_gen = meta["last_improvement_gen"]
+        self.convergence_info = cp.info_from_json(meta["convergence_info"])
+        self.global_min_info = cp.info_from_json(meta["global_min_info"])
+        self.stop_reason = meta["stop_reason"]
+        self.internal_multiplications = meta["internal_multiplications"]
+        self.internal_divisions = meta["internal_divisions"]
+        cp.restore_evaluator(self.func_evaluator, meta["evaluator"])
+        self.rng.bit_generator.state = meta["rng_state"]
+
+        if self.termination is not None:
+            self.termination.start(self.func_evaluator)
+            self.termination._start_evaluations = meta.get(
+                "termination_start_evaluations", 0)
+
+    def run(self):
+        if self.resume_from is not None:
+            self.load_checkpoint(self.resume_from)
+        else:
+            self.start()
+
+        if self.checkpoint_every:
+            while self.is_running():
+                self.evolve(self.checkpoint_every)
+                self.save_checkpoint(self.checkpoint_path)
+        else:
+            self.evolve(self.generations)
+
+        if self.convergence_info is None:
+            self.convergence_info = (self.func_evaluator.get_stats(),
+                                     self.internal_multiplications,
+                                     self.internal_divisions)
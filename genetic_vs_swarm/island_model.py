@@ -0,0 +1,132 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from . import evaluator as ev
+from . import genetic_alg as ga
+from . import random_streams as rs
+
+
+def _evolve_island(island, generations):
+    # Executado no processo worker; a ilha volta serializada com o novo estado
+    island.evolve(generations)
+    return island
+
+
+class IslandGeneticAlgorithm:
+    """
+    Modelo de ilhas: `n_islands` populações do GeneticAlgorithm evoluem em
+    paralelo em um pool de processos e, a cada `migration_interval`
+    gerações, cada ilha envia seu melhor indivíduo às vizinhas definidas
+    pela topologia ('ring': apenas para a próxima ilha; 'full': para todas).
+    Os migrantes substituem indivíduos sorteados da população de destino.
+
+    Cada ilha tem seu próprio avaliador e seu próprio fluxo aleatório,
+    derivado de `seed`. Os contadores de avaliações e operações são somados
+    entre as ilhas; como a agregação acontece entre épocas de migração,
+    `global_min_info` e `convergence_info` têm a granularidade de uma época.
+    """
+
+    def __init__(self, func_evaluator, bounds=None, n_islands=4, migration_interval=10,
+                 topology='ring', workers=None, seed=None, **ga_params):
+        if isinstance(func_evaluator, str):
+            func_evaluator = ev.FunctionEvaluator(func_evaluator)
+        if topology not in ('ring', 'full'):
+            raise ValueError(f"Topologia de migração desconhecida: '{topology}'.")
+        # Sem limites explícitos, usa os declarados pela função objetivo
+        if bounds is None:
+            bounds = func_evaluator.default_bounds()
+
+        self.func_evaluator = func_evaluator
+        self.bounds = bounds
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.topology = topology
+        self.workers = workers
+        self.seed = seed
+        self.ga_params = ga_params
+
+        self.islands = []
+        self.best_solution = None
+        self.best_fitness = float('inf')
+        self.convergence_info = None
+        self.global_min_info = None
+
+        self.internal_multiplications = 0
+        self.internal_divisions = 0
+
+    def _create_islands(self):
+        islands = []
+        for rng in rs.spawn_generators(self.seed, self.n_islands):
+            evaluator = copy.deepcopy(self.func_evaluator)
+            evaluator.reset()
+            island = ga.GeneticAlgorithm(evaluator, self.bounds, seed=rng, **self.ga_params)
+            island.start()
+            islands.append(island)
+        return islands
+
+    def _migrate(self):
+        migrants = [island.best_solution.copy() for island in self.islands]
+
+        for i, island in enumerate(self.islands):
+            if self.topology == 'ring':
+                incoming = [migrants[i - 1]]
+            else:
+                incoming = [m for j, m in enumerate(migrants) if j != i]
+
+            targets = island.rng.choice(island.pop_size, size=len(incoming), replace=False)
+            island.population[targets] = incoming
+
+    def get_stats(self):
+        """
+        Estatísticas do avaliador somadas entre todas as ilhas.
+        """
+        stats = {"evaluations": 0, "multiplications": 0, "divisions": 0}
+        for island in self.islands:
+            for key, value in island.func_evaluator.get_stats().items():
+                stats[key] += value
+        return stats
+
+    def _aggregate(self):
+        self.internal_multiplications = sum(i.internal_multiplications for i in self.islands)
+        self.internal_divisions = sum(i.internal_divisions for i in self.islands)
+        return (self.get_stats(), self.internal_multiplications, self.internal_divisions)
+
+    def run(self):
+        self.islands = self._create_islands()
+        generation = 0
+        last_improvement_gen = 0
+
+        executor = None
+        if self.workers != 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        try:
+            while any(island.is_running() for island in self.islands):
+                if executor is None:
+                    self.islands = [_evolve_island(island, self.migration_interval)
+                                    for island in self.islands]
+                else:
+                    self.islands = list(executor.map(
+                        _evolve_island, self.islands, repeat(self.migration_interval)))
+                generation += self.migration_interval
+
+                best = min(self.islands, key=lambda island: island.best_fitness)
+                info = self._aggregate()
+                if best.best_fitness < self.best_fitness:
+                    self.best_fitness = best.best_fitness
+                    self.best_solution = best.best_solution.copy()
+                    self.global_min_info = info
+                    last_improvement_gen = generation
+
+                # Critério de convergência: se não houver melhora por 20 gerações
+                if generation - last_improvement_gen > 20 and self.convergence_info is None:
+                    self.convergence_info = info
+
+                self._migrate()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if self.convergence_info is None:
+            self.convergence_info = self._aggregate()
@@ -0,0 +1,129 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from . import evaluator as ev
+from . import particle_swarm as ps
+from . import random_streams as rs
+
+
+def _evolve_swarm(swarm, iterations):
+    # Executado no processo worker; o sub-enxame volta serializado com o novo estado
+    swarm.evolve(iterations)
+    return swarm
+
+
+class MultiSwarmOptimization:
+    """
+    PSO com múltiplos enxames: `n_swarms` sub-enxames do
+    ParticleSwarmOptimization evoluem em paralelo em um pool de processos
+    e, a cada `exchange_interval` iterações, compartilham o melhor ponto
+    encontrado. Um sub-enxame que ainda não o conhece passa a usá-lo como
+    gbest e o copia para o melhor pessoal de sua pior partícula, de modo
+    que a informação também se propague em topologias locais.
+
+    Cada sub-enxame tem seu próprio avaliador e seu próprio fluxo
+    aleatório, derivado de `seed`. Os contadores são somados entre os
+    sub-enxames; `global_min_info` e `convergence_info` têm a granularidade
+    de um intervalo de troca.
+    """
+
+    def __init__(self, func_evaluator, bounds=None, n_swarms=4, exchange_interval=10,
+                 workers=None, seed=None, **pso_params):
+        if isinstance(func_evaluator, str):
+            func_evaluator = ev.FunctionEvaluator(func_evaluator)
+        # Sem limites explícitos, usa os declarados pela função objetivo
+        if bounds is None:
+            bounds = func_evaluator.default_bounds()
+
+        self.func_evaluator = func_evaluator
+        self.bounds = bounds
+        self.n_swarms = n_swarms
+        self.exchange_interval = exchange_interval
+        self.workers = workers
+        self.seed = seed
+        self.pso_params = pso_params
+
+        self.swarms = []
+        self.gbest_pos = None
+        self.gbest_val = float('inf')
+        self.convergence_info = None
+        self.global_min_info = None
+
+        self.internal_multiplications = 0
+        self.internal_divisions = 0
+
+    def _create_swarms(self):
+        swarms = []
+        for rng in rs.spawn_generators(self.seed, self.n_swarms):
+            evaluator = copy.deepcopy(self.func_evaluator)
+            evaluator.reset()
+            swarm = ps.ParticleSwarmOptimization(evaluator, self.bounds, seed=rng,
+                                                 **self.pso_params)
+            swarm.start()
+            swarms.append(swarm)
+        return swarms
+
+    def _share_best(self):
+        for swarm in self.swarms:
+            if swarm.gbest_val <= self.gbest_val:
+                continue
+            swarm.gbest_val = self.gbest_val
+            swarm.gbest_pos = self.gbest_pos.copy()
+
+            worst = swarm.particles_pbest_val.argmax()
+            swarm.particles_pbest_val[worst] = self.gbest_val
+            swarm.particles_pbest_pos[worst] = self.gbest_pos
+
+    def get_stats(self):
+        """
+        Estatísticas do avaliador somadas entre todos os sub-enxames.
+        """
+        stats = {"evaluations": 0, "multiplications": 0, "divisions": 0}
+        for swarm in self.swarms:
+            for key, value in swarm.func_evaluator.get_stats().items():
+                stats[key] += value
+        return stats
+
+    def _aggregate(self):
+        self.internal_multiplications = sum(s.internal_multiplications for s in self.swarms)
+        self.internal_divisions = sum(s.internal_divisions for s in self.swarms)
+        return (self.get_stats(), self.internal_multiplications, self.internal_divisions)
+
+    def run(self):
+        self.swarms = self._create_swarms()
+        iteration = 0
+        last_improvement_iter = 0
+
+        executor = None
+        if self.workers != 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        try:
+            while any(swarm.is_running() for swarm in self.swarms):
+                if executor is None:
+                    self.swarms = [_evolve_swarm(swarm, self.exchange_interval)
+                                   for swarm in self.swarms]
+                else:
+                    self.swarms = list(executor.map(
+                        _evolve_swarm, self.swarms, repeat(self.exchange_interval)))
+                iteration += self.exchange_interval
+
+                best = min(self.swarms, key=lambda swarm: swarm.gbest_val)
+                info = self._aggregate()
+                if best.gbest_val < self.gbest_val:
+                    self.gbest_val = best.gbest_val
+                    self.gbest_pos = best.gbest_pos.copy()
+                    self.global_min_info = info
+                    last_improvement_iter = iteration
+
+                if iteration - last_improvement_iter > 20 and self.convergence_info is None:
+                    self.convergence_info = info
+
+                self._share_best()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if self.convergence_info is None:
+            self.convergence_info = self._aggregate()
@@ -0,0 +1,144 @@
+import numpy as np
+
+
+class Objective:
+    """
+    Descreve uma função objetivo de benchmark: implementação vetorizada,
+    limites de busca, ótimo conhecido e contagem de operações por chamada.
+
+    `function` recebe um array (N, dim) de pontos e retorna um array (N,).
+    As contagens de multiplicações/divisões de uma chamada são
+    `multiplications + multiplications_per_dim * dim` (idem para divisões).
+    `dim` fixa a dimensão aceita pela função; None indica qualquer dimensão.
+    """
+
+    def __init__(self, name, function, bounds, optimum=None, optimum_position=None,
+                 multiplications=0, divisions=0, multiplications_per_dim=0,
+                 divisions_per_dim=0, dim=None):
+        self.name = name
+        self.function = function
+        self.bounds = bounds
+        self.optimum = optimum
+        self.optimum_position = optimum_position
+        self.multiplications = multiplications
+        self.divisions = divisions
+        self.multiplications_per_dim = multiplications_per_dim
+        self.divisions_per_dim = divisions_per_dim
+        self.dim = dim
+
+    def op_counts(self, dim):
+        """
+        Retorna (multiplicações, divisões) de uma avaliação em `dim` dimensões.
+        """
+        return (self.multiplications + self.multiplications_per_dim * dim,
+                self.divisions + self.divisions_per_dim * dim)
+
+    def __call__(self, *coords):
+        return float(self.function(np.array([coords], dtype=float))[0])
+
+
+def w22(points):
+    # f(x,y) = (x - y) * (-x * sin(sqrt|x|) - y * sin(sqrt|y|))
+    x, y = points[:, 0], points[:, 1]
+    term1 = -x * np.sin(np.sqrt(np.abs(x)))
+    term2 = -y * np.sin(np.sqrt(np.abs(y)))
+    return (x - y) * (term1 + term2)
+
+
+def schwefel(points):
+    # f(x) = 418.9829 * d - sum(x_i * sin(sqrt|x_i|))
+    dim = points.shape[1]
+    return 418.9829 * dim - np.sum(points * np.sin(np.sqrt(np.abs(points))), axis=1)
+
+
+def rastrigin(points):
+    # f(x) = 10 * d + sum(x_i^2 - 10 * cos(2 * pi * x_i))
+    dim = points.shape[1]
+    return 10 * dim + np.sum(points * points - 10 * np.cos(2 * np.pi * points), axis=1)
+
+
+def ackley(points):
+    # f(x) = -20 * exp(-0.2 * sqrt(sum(x_i^2) / d)) - exp(sum(cos(2 * pi * x_i)) / d) + 20 + e
+    dim = points.shape[1]
+    term1 = -20 * np.exp(-0.2 * np.sqrt(np.sum(points * points, axis=1) / dim))
+    term2 = -np.exp(np.sum(np.cos(2 * np.pi * points), axis=1) / dim)
+    return term1 + term2 + 20 + np.e
+
+
+def rosenbrock(points):
+    # f(x) = sum(100 * (x_{i+1} - x_i^2)^2 + (1 - x_i)^2)
+    x, x_next = points[:, :-1], points[:, 1:]
+    return np.sum(100 * (x_next - x * x) ** 2 + (1 - x) ** 2, axis=1)
+
+
+def sphere(points):
+    # f(x) = sum(x_i^2)
+    return np.sum(points * points, axis=1)
+
+
+def griewank(points):
+    # f(x) = 1 + sum(x_i^2 / 4000) - prod(cos(x_i / sqrt(i)))
+    divisors = np.sqrt(np.arange(1, points.shape[1] + 1))
+    return 1 + np.sum(points * points / 4000, axis=1) - np.prod(np.cos(points / divisors), axis=1)
+
+
+def resolve_bounds(bounds, dim):
+    """
+    Converte os limites em dois arrays (dim,) de mínimos e máximos. Aceita
+    um par [min, max] comum a todas as dimensões ou uma sequência de `dim`
+    pares [min, max], um por dimensão.
+    """
+    bounds = np.asarray(bounds, dtype=float)
+    if bounds.shape == (2,):
+        return np.full(dim, bounds[0]), np.full(dim, bounds[1])
+    if bounds.shape == (dim, 2):
+        return bounds[:, 0].copy(), bounds[:, 1].copy()
+    raise ValueError(f"Limites com formato {bounds.shape} incompatíveis com "
+                     f"{dim} dimensões; use [min, max] ou {dim} pares [min, max].")
+
+
+_registry = {}
+
+
+def register(objective):
+    """
+    Registra uma função objetivo para uso por nome.
+    """
+    _registry[objective.name] = objective
+    return objective
+
+
+def get_objective(name):
+    if name not in _registry:
+        raise ValueError(f"Função objetivo desconhecida: '{name}'. "
+                         f"Disponíveis: {', '.join(sorted(_registry))}")
+    return _registry[name]
+
+
+def available_objectives():
+    return sorted(_registry)
+
+
+# CONTANDO AS OPERAÇÕES DE CADA FUNÇÃO
+# w22: -x*sin, -y*sin, (x-y)*(...) -> 3 mult.
+# schwefel: x_i*sin por dimensão + 418.9829*d -> d + 1 mult.
+# rastrigin: x_i*x_i, 10*cos, 2*pi*x_i por dimensão + 10*d -> 3d + 1 mult.
+# ackley: x_i*x_i, 2*pi*x_i por dimensão + -20*, -0.2* -> 2d + 2 mult; 2 div.
+# rosenbrock: x_i*x_i, (..)^2, 100*, (1-x_i)^2 por termo (d - 1 termos) -> 4d - 4 mult.
+# sphere: x_i*x_i por dimensão -> d mult.
+# griewank: x_i*x_i e o produtório por dimensão -> 2d mult; x_i^2/4000 e x_i/sqrt(i) -> 2d div.
+register(Objective('w22', w22, bounds=[-500, 500], optimum=-552957.8063564874,
+                   optimum_position=[423.5355701, -500.0], multiplications=3, dim=2))
+register(Objective('schwefel', schwefel, bounds=[-500, 500], optimum=0.0,
+                   optimum_position=420.9687, multiplications=1, multiplications_per_dim=1))
+register(Objective('rastrigin', rastrigin, bounds=[-5.12, 5.12], optimum=0.0,
+                   optimum_position=0.0, multiplications=1, multiplications_per_dim=3))
+register(Objective('ackley', ackley, bounds=[-32.768, 32.768], optimum=0.0,
+                   optimum_position=0.0, multiplications=2, divisions=2,
+                   multiplications_per_dim=2))
+register(Objective('rosenbrock', rosenbrock, bounds=[-5, 10], optimum=0.0,
+                   optimum_position=1.0, multiplications=-4, multiplications_per_dim=4))
+register(Objective('sphere', sphere, bounds=[-5.12, 5.12], optimum=0.0,
+                   optimum_position=0.0, multiplications_per_dim=1))
+register(Objective('griewank', griewank, bounds=[-600, 600], optimum=0.0,
+                   optimum_position=0.0, multiplications_per_dim=2, divisions_per_dim=2))
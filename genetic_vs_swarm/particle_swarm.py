@@ -0,0 +1,461 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import numpy as np
+
+from . import checkpoint as cp
+from . import evaluator as ev
+from . import objectives as obj
+from . import profiling as pf
+from . import random_streams as rs
+from . import telemetry as tl
+
+
+class ParticleSwarmOptimization:
+    def __init__(self, func_evaluator, bounds=None, swarm_size=50, iterations=100,
+                 w=0.5, c1=1.5, c2=1.5, dim=2, topology='global', seed=None,
+                 termination=None, checkpoint_path=None, checkpoint_every=None,
+                 resume_from=None, telemetry=None, profile=False):
+        # Aceita também o nome de uma função do registro (objectives.py)
+        if isinstance(func_evaluator, str):
+            func_evaluator = ev.FunctionEvaluator(func_evaluator)
+        self.func_evaluator = func_evaluator
+        # Sem limites explícitos, usa os declarados pela função objetivo
+        if bounds is None:
+            bounds = func_evaluator.default_bounds()
+        self.bounds = bounds
+        self.dim = dim
+        # Limites por dimensão, arrays (dim,)
+        self.lower, self.upper = obj.resolve_bounds(bounds, dim)
+        self.swarm_size = swarm_size
+        self.iterations = iterations
+        self.w = w    # Inércia
+        self.c1 = c1  # Coeficiente Cognitivo
+        self.c2 = c2  # Coeficiente Social
+        # Vizinhança usada no termo social: 'global' (gbest), 'ring' ou 'von_neumann' (lbest)
+        if topology not in ('global', 'ring', 'von_neumann'):
+            raise ValueError(f"Topologia de vizinhança desconhecida: '{topology}'.")
+        self.topology = topology
+        # Todos os sorteios usam este gerador (semente, SeedSequence ou Generator)
+        self.rng = rs.make_rng(seed)
+        # Política de parada antecipada opcional (termination.Termination)
+        self.termination = termination
+        # Checkpoint a cada `checkpoint_every` iterações em `checkpoint_path`;
+        # `resume_from` retoma uma execução a partir de um checkpoint salvo
+        if (checkpoint_path is None) != (not checkpoint_every):
+            raise ValueError("checkpoint_path e checkpoint_every devem ser informados juntos.")
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.resume_from = resume_from
+        # Sink opcional que recebe um registro (telemetry.telemetry_dtype) por iteração
+        self.telemetry = telemetry
+        # Instrumentação opcional do tempo gasto em cada fase da iteração
+        self.profiler = pf.PhaseProfiler() if profile else None
+
+        self.particles_pos = None
+        self.particles_vel = None
+        self.particles_pbest_pos = None
+        self.particles_pbest_val = np.full(self.swarm_size, float('inf'))
+        self.neighbors = None
+        self.gbest_pos = None
+        self.gbest_val = float('inf')
+        self.convergence_info = None
+        self.global_min_info = None
+        self.stop_reason = None
+        self.iteration = 0
+        self.last_improvement_iter = 0
+
+        self.internal_multiplications = 0
+        self.internal_divisions = 0
+        self._start_ns = 0
+
+    def _initialize_swarm(self):
+        self.particles_pos = self.rng.uniform(
+            self.lower, self.upper, (self.swarm_size, self.dim))
+
+        self.particles_vel = self.rng.uniform(-1, 1, (self.swarm_size, self.dim))
+
+        self.particles_pbest_pos = self.particles_pos.copy()
+        self.particles_pbest_val = np.full(self.swarm_size, float('inf'))
+
+        self.neighbors = self._build_neighbors()
+
+    def _build_neighbors(self):
+        """
+        Índices (swarm_size, k) da vizinhança de cada partícula, incluindo
+        ela mesma. None na topologia global.
+        """
+        n = self.swarm_size
+        idx = np.arange(n)
+        if self.topology == 'ring':
+            return (idx[:, None] + np.array([0, -1, 1])) % n
+        if self.topology != 'von_neumann':
+            return None
+
+        # Grade toroidal rows x cols com rows o maior divisor de n que não
+        # passa de sqrt(n) (n primo degenera em um anel): a própria partícula,
+        # esquerda e direita na mesma linha, acima e abaixo na mesma coluna
+        rows = max(d for d in range(1, int(np.sqrt(n)) + 1) if n % d == 0)
+        cols = n // rows
+        row, col = np.divmod(idx, cols)
+        return np.stack([
+            idx,
+            row * cols + (col - 1) % cols,
+            row * cols + (col + 1) % cols,
+            ((row - 1) % rows) * cols + col,
+            ((row + 1) % rows) * cols + col,
+        ], axis=1)
+
+    def _social_target(self):
+        if self.neighbors is None:
+            return self.gbest_pos
+
+        # Melhor pessoal de cada vizinhança (lbest)
+        neighbor_vals = self.particles_pbest_val[self.neighbors]
+        best = self.neighbors[np.arange(self.swarm_size), np.argmin(neighbor_vals, axis=1)]
+        return self.particles_pbest_pos[best]
+
+    def start(self):
+        """
+        Prepara uma nova execução (enxame inicial, contadores e política de
+        parada) sem avançar nenhuma iteração.
+        """
+        self.internal_multiplications = 0
+        self.internal_divisions = 0
+        self._start_ns = time.perf_counter_ns()
+        if self.profiler is not None:
+            self.profiler.reset()
+
+        self.stop_reason = None
+        self.iteration = 0
+        self.last_improvement_iter = 0
+        # Nada da execução anterior é aproveitado
+        self.gbest_pos = None
+        self.gbest_val = float('inf')
+        self.convergence_info = None
+        self.global_min_info = None
+
+        self._initialize_swarm()
+        if self.termination is not None:
+            self.termination.start(self.func_evaluator)
+            # O orçamento também vale para a primeira geração/iteração
+            self.stop_reason = self.termination.check_budget(self.func_evaluator, self.swarm_size)
+
+    def is_running(self):
+        return self.iteration < self.iterations and self.stop_reason is None
+
+    def evolve(self, iterations):
+        """
+        Avança até `iterations` iterações a partir do estado atual, limitado
+        ao total configurado e à política de parada. Retorna True enquanto
+        ainda houver iterações a executar.
+        """
+        prof = self.profiler
+
+        for _ in range(iterations):
+            if not self.is_running():
+                break
+
+            it = self.iteration
+            if prof is not None:
+                t = time.perf_counter_ns()
+
+            # 1. Avaliação de todo o enxame em uma única chamada
+            current_vals = self.func_evaluator.evaluate_batch(self.particles_pos)
+            if prof is not None:
+                t = prof.lap('evaluation', t)
+
+            # 2. Atualização dos melhores pessoais por atribuição mascarada
+            improved = current_vals < self.particles_pbest_val
+            self.particles_pbest_val[improved] = current_vals[improved]
+            self.particles_pbest_pos[improved] = self.particles_pos[improved]
+
+            # 3. Atualização do melhor global
+            best_idx = int(np.argmin(current_vals))
+            if current_vals[best_idx] < self.gbest_val:
+                self.gbest_val = float(current_vals[best_idx])
+                self.gbest_pos = self.particles_pos[best_idx].copy()
+                # Estatísticas no instante em que a partícula foi avaliada
+                self.global_min_info = (self.func_evaluator.get_batch_stats(best_idx + 1),
+                                        self.internal_multiplications,
+                                        self.internal_divisions)
+                self.last_improvement_iter = it
+
+            if self.telemetry is not None:
+                self.telemetry(tl.make_record(
+                    it, current_vals, self.gbest_val, self.particles_pos,
+                    self.func_evaluator.evaluations, time.perf_counter_ns() - self._start_ns))
+            if prof is not None:
+                t = prof.lap('best_update', t)
+
+            r1 = self.rng.random((self.swarm_size, self.dim))
+            r2 = self.rng.random((self.swarm_size, self.dim))
+
+            # CONTANDO AS MULTIPLICAÇÕES NA ATUALIZAÇÃO DE VELOCIDADE
+            # Para cada partícula (vetor de dim dimensões):
+            # w * vel -> dim mult.
+            # c1 * r1 -> dim mult.
+            # (c1*r1) * (pbest - pos) -> dim mult.
+            # c2 * r2 -> dim mult.
+            # (c2*r2) * (gbest - pos) -> dim mult.
+            # Total: 5 * dim multiplicações por partícula (10 em 2D).
+            self.internal_multiplications += 5 * self.dim * self.swarm_size
+
+            # c1*r1*(pi - xij)
+            cognitive_vel = self.c1 * r1 * \
+                (self.particles_pbest_pos - self.particles_pos)
+
+            # c2*r2*(gi - xij), com gi = gbest ou o lbest da vizinhança
+            social_vel = self.c2 * r2 * (self._social_target() - self.particles_pos)
+
+            # vij = w*vij + c1*r1*(pi - xij) + c2*r2*(gi - xij)
+            self.particles_vel = self.w * self.particles_vel + cognitive_vel + social_vel
+            if prof is not None:
+                t = prof.lap('velocity_update', t)
+
+            # xi = xi + vi
+            self.particles_pos += self.particles_vel
+            if prof is not None:
+                t = prof.lap('position_update', t)
+
+            # Garante que as partículas permaneçam dentro dos limites
+            np.clip(self.particles_pos, self.lower, self.upper,
+                    out=self.particles_pos)
+            if prof is not None:
+                prof.lap('clipping', t)
+
+            self.iteration += 1
+
+            if it - self.last_improvement_iter > 20 and self.convergence_info is None:
+                self.convergence_info = (self.func_evaluator.get_stats(),
+                                         self.internal_multiplications,
+                                         self.internal_divisions)
+
+            if self.termination is not None:
+                self.stop_reason = self.termination.check(
+                    it, self.last_improvement_iter, self.gbest_val,
+                    self.func_evaluator, self.swarm_size)
+
+        return self.is_running()
+
+    def get_profile(self):
+        """
+        Relatório por fase (evaluation, best_update, velocity_update,
+        position_update, clipping) com chamadas e tempo em ns; vazio se a
+        execução não foi instrumentada com profile=True.
+        """
+        return self.profiler.report() if self.profiler is not None else {}
+
+    def _checkpoint_params(self):
+        # Parâmetros que precisam coincidir para retomar um checkpoint
+        return {
+            "swarm_size": self.swarm_size,
+            "dim": self.dim,
+            "lower": self.lower.tolist(),
+            "upper": self.upper.tolist(),
+            "w": self.w,
+            "c1": self.c1,
+            "c2": self.c2,
+            "topology": self.topology,
+        }
+
+    def save_checkpoint(self, path):
+        """
+        Salva todo o estado necessário para continuar a execução de forma
+        idêntica: posições, velocidades, melhores pessoais e global,
+        contadores, informações de convergência e o estado do gerador.
+        """
+        arrays = {
+            "particles_pos": self.particles_pos,
+            "particles_vel": self.particles_vel,
+            "particles_pbest_pos": self.particles_pbest_pos,
+            "particles_pbest_val": self.particles_pbest_val,
+        }
+        if self.gbest_pos is not None:
+            arrays["gbest_pos"] = self.gbest_pos
+
+        meta = {
+            "algorithm": "PSO",
+            "params": self._checkpoint_params(),
+            "iteration": self.iteration,
+            "elapsed_ns": time.perf_counter_ns() - self._start_ns,
+            "last_improvement_iter": self.last_improvement_iter,
+            "gbest_val": self.gbest_val,
+            "convergence_info": cp.info_to_json(self.convergence_info),
+            "global_min_info": cp.info_to_json(self.global_min_info),
+            "stop_reason": self.stop_reason,
+            "internal_multiplications": self.internal_multiplications,
+            "internal_divisions": self.internal_divisions,
+            "evaluator": cp.evaluator_state(self.func_evaluator),
+            "rng_state": self.rng.bit_generator.state,
+        }
+        if self.termination is not None:
+            meta["termination_start_evaluations"] = self.termination._start_evaluations
+
+        cp.save_checkpoint(path, arrays, meta)
+
+    def load_checkpoint(self, path):
+        """
+        Restaura o estado salvo por save_checkpoint; checkpoints com outro
+        tamanho, dimensão ou parâmetros são rejeitados. O prazo de relógio da
+        política de parada, se houver, recomeça a contar na retomada.
+        """
+        arrays, meta = cp.load_checkpoint(path)
+        if meta["algorithm"] != "PSO":
+            raise ValueError(f"O checkpoint '{path}' não é de um ParticleSwarmOptimization.")
+        shape = (self.swarm_size, self.dim)
+        cp.check_compatible(path, arrays, meta,
+                            {"particles_pos": shape, "particles_vel": shape,
+                             "particles_pbest_pos": shape,
+                             "particles_pbest_val": (self.swarm_size,),
+                             "gbest_pos": (self.dim,)},
+                            self._checkpoint_params())
+
+        self.particles_pos = arrays["particles_pos"]
+        self.particles_vel = arrays["particles_vel"]
+        self.particles_pbest_pos = arrays["particles_pbest_pos"]
+        self.particles_pbest_val = arrays["particles_pbest_val"]
+        self.gbest_pos = arrays.get("gbest_pos")
+        self.gbest_val = meta["gbest_val"]
+        self.neighbors = self._build_neighbors()
+        self.iteration = meta["iteration"]
+        self._start_ns = time.perf_counter_ns() - meta["elapsed_ns"]
+        self.last_improvement_iter = meta["last_improvement_iter"]
+        self.convergence_info = cp.info_from_json(meta["convergence_info"])
+        self.global_min_info = cp.info_from_json(meta["global_min_info"])
+        self.stop_reason = meta["stop_reason"]
+        self.internal_multiplications = meta["internal_multiplications"]
+        self.internal_divisions = meta["internal_divisions"]
+        cp.restore_evaluator(self.func_evaluator, meta["evaluator"])
+        self.rng.bit_generator.state = meta["rng_state"]
+
+        if self.termination is not None:
+            self.termination.start(self.func_evaluator)
+            self.termination._start_evaluations = meta.get(
+                "termination_start_evaluations", 0)
+
+    def run(self):
+        if self.resume_from is not None:
+            self.load_checkpoint(self.resume_from)
+        else:
+            self.start()
+
+        if self.checkpoint_every:
+            while self.is_running():
+                self.evolve(self.checkpoint_every)
+                self.save_checkpoint(self.checkpoint_path)
+        else:
+            self.evolve(self.iterations)
+
+        if self.convergence_info is None:
+            self.convergence_info = (self.func_evaluator.get_stats(),
+                                     self.internal_multiplications,
+                                     self.internal_divisions)
+
+
+class AsynchronousParticleSwarmOptimization(ParticleSwarmOptimization):
+    """
+    Variante assíncrona (steady-state) do PSO para funções objetivo caras.
+    Todas as partículas são submetidas ao avaliador de uma vez e cada uma é
+    atualizada e ressubmetida assim que seu resultado chega, usando o
+    melhor global/local conhecido naquele instante, sem esperar o restante
+    do enxame. O orçamento é o mesmo da versão síncrona
+    (swarm_size * iterations avaliações), e cada bloco de swarm_size
+    avaliações concluídas conta como uma iteração para os critérios de
+    convergência e de parada.
+
+    Cada atualização de partícula custa as mesmas 5 * dim multiplicações
+    da versão síncrona, mas só há atualização entre duas avaliações: a
+    versão síncrona também atualiza o enxame após a última avaliação, de
+    modo que o total de operações internas aqui é 5 * dim * swarm_size
+    menor para o mesmo orçamento.
+
+    Requer um avaliador com submit/collect (evaluator.ConcurrentEvaluator).
+    Como a ordem de chegada dos resultados varia, execuções com a mesma
+    semente não são necessariamente idênticas; checkpoint, telemetria e
+    profiling não se aplicam a esta variante, e seus parâmetros são
+    rejeitados.
+    """
+
+    _unsupported = ('checkpoint_path', 'checkpoint_every', 'resume_from', 'telemetry', 'profile')
+
+    def __init__(self, func_evaluator, bounds=None, **params):
+        unsupported = [name for name in self._unsupported if name in params]
+        if unsupported:
+            raise ValueError(f"Parâmetros não suportados pelo PSO assíncrono: "
+                             f"{', '.join(unsupported)}.")
+        super().__init__(func_evaluator, bounds, **params)
+
+    def _update_particle(self, i):
+        r1 = self.rng.random(self.dim)
+        r2 = self.rng.random(self.dim)
+
+        # 5 * dim multiplicações por atualização, como na versão síncrona
+        self.internal_multiplications += 5 * self.dim
+
+        if self.neighbors is None:
+            social_target = self.gbest_pos
+        else:
+            neighbors = self.neighbors[i]
+            social_target = self.particles_pbest_pos[
+                neighbors[np.argmin(self.particles_pbest_val[neighbors])]]
+
+        cognitive_vel = self.c1 * r1 * (self.particles_pbest_pos[i] - self.particles_pos[i])
+        social_vel = self.c2 * r2 * (social_target - self.particles_pos[i])
+        self.particles_vel[i] = self.w * self.particles_vel[i] + cognitive_vel + social_vel
+
+        self.particles_pos[i] += self.particles_vel[i]
+        np.clip(self.particles_pos[i], self.lower, self.upper, out=self.particles_pos[i])
+
+    def run(self):
+        self.start()
+
+        budget = self.swarm_size * self.iterations
+        pending = {}
+        if self.stop_reason is None:
+            pending = {self.func_evaluator.submit(self.particles_pos[i]): i
+                       for i in range(self.swarm_size)}
+        submitted = len(pending)
+        completed = 0
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = pending.pop(future)
+                current_val = self.func_evaluator.collect(future)
+                it = completed // self.swarm_size
+                completed += 1
+
+                if current_val < self.particles_pbest_val[i]:
+                    self.particles_pbest_val[i] = current_val
+                    self.particles_pbest_pos[i] = self.particles_pos[i].copy()
+
+                if current_val < self.gbest_val:
+                    self.gbest_val = float(current_val)
+                    self.gbest_pos = self.particles_pos[i].copy()
+                    self.global_min_info = (self.func_evaluator.get_stats(),
+                                            self.internal_multiplications,
+                                            self.internal_divisions)
+                    self.last_improvement_iter = it
+
+                # Fim de um bloco de swarm_size avaliações: uma "iteração"
+                if completed % self.swarm_size == 0:
+                    self.iteration = it + 1
+                    if it - self.last_improvement_iter > 20 and self.convergence_info is None:
+                        self.convergence_info = (self.func_evaluator.get_stats(),
+                                                 self.internal_multiplications,
+                                                 self.internal_divisions)
+                    if self.termination is not None and self.stop_reason is None:
+                        self.stop_reason = self.termination.check(
+                            it, self.last_improvement_iter, self.gbest_val,
+                            self.func_evaluator, self.swarm_size)
+
+                if submitted < budget and self.stop_reason is None:
+                    self._update_particle(i)
+                    pending[self.func_evaluator.submit(self.particles_pos[i])] = i
+                    submitted += 1
+
+        if self.convergence_info is None:
+            self.convergence_info = (self.func_evaluator.get_stats(),
+                                     self.internal_multiplications,
+                                     self.internal_divisions)
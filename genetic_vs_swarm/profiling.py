@@ -0,0 +1,49 @@
+import time
+
+
+class PhaseProfiler:
+    """
+    Acumula tempo de relógio (perf_counter_ns) e número de chamadas por fase
+    do laço principal dos otimizadores. O uso segue o padrão
+
+        t = time.perf_counter_ns()
+        ...fase A...
+        t = profiler.lap('fase_a', t)
+        ...fase B...
+        t = profiler.lap('fase_b', t)
+
+    de modo que cada fase custa uma única leitura do relógio.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.total_ns = {}
+        self.calls = {}
+
+    def lap(self, phase, start_ns):
+        """
+        Atribui o tempo decorrido desde `start_ns` à fase e retorna o
+        instante atual, que serve de início para a próxima fase.
+        """
+        now = time.perf_counter_ns()
+        self.total_ns[phase] = self.total_ns.get(phase, 0) + now - start_ns
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        return now
+
+    def report(self):
+        """
+        Retorna {fase: {'calls', 'total_ns', 'mean_ns', 'share'}}, onde
+        'share' é a fração do tempo total medido gasta na fase.
+        """
+        overall = sum(self.total_ns.values())
+        return {
+            phase: {
+                'calls': self.calls[phase],
+                'total_ns': total,
+                'mean_ns': total / self.calls[phase],
+                'share': total / overall if overall else 0.0,
+            }
+            for phase, total in self.total_ns.items()
+        }
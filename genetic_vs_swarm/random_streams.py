@@ -0,0 +1,29 @@
+import numpy as np
+
+
+def make_rng(seed=None):
+    """
+    Cria um numpy.random.Generator a partir de uma semente inteira, de uma
+    SeedSequence ou de um Generator já existente (retornado sem cópia).
+    """
+    return np.random.default_rng(seed)
+
+
+def spawn_seeds(seed, n):
+    """
+    Deriva `n` sementes inteiras independentes a partir de uma semente base,
+    usando SeedSequence.spawn. Sementes inteiras podem ser registradas em
+    arquivos de resultados e reproduzidas depois com make_rng; são limitadas
+    a 63 bits para caber em um INTEGER do SQLite.
+    """
+    children = np.random.SeedSequence(seed).spawn(n)
+    return [int(child.generate_state(1, np.uint64)[0] >> np.uint64(1)) for child in children]
+
+
+def spawn_generators(seed, n):
+    """
+    Cria `n` geradores com fluxos estatisticamente independentes, próprios
+    para execuções repetidas ou paralelas de um mesmo experimento.
+    """
+    return [np.random.default_rng(child)
+            for child in np.random.SeedSequence(seed).spawn(n)]
@@ -0,0 +1,137 @@
+import csv
+import sqlite3
+
+
+# Colunas de cada execução e seus tipos no SQLite
+result_columns = {
+    'algorithm': 'TEXT NOT NULL',
+    'objective': 'TEXT',
+    'pop_or_swarm_size': 'INTEGER',
+    'gens_or_iterations': 'INTEGER',
+    'crossover_rate': 'REAL',
+    'mutation_rate': 'REAL',
+    'w': 'REAL',
+    'c1': 'REAL',
+    'c2': 'REAL',
+    'best_fitness': 'REAL',
+    'evaluations_to_find_min': 'INTEGER',
+    'total_ops_to_find_min': 'INTEGER',
+    'execution_time': 'REAL',
+    'seed': 'INTEGER',
+    'evaluations': 'INTEGER',
+    'run_key': 'TEXT',
+}
+
+_converters = {'TEXT': str, 'INTEGER': int, 'REAL': float}
+
+
+class ResultsStore:
+    """
+    Armazena os resultados da varredura de hiperparâmetros em um banco
+    SQLite, com tipos preservados e um índice em (algorithm, best_fitness),
+    de modo que a melhor configuração de cada algoritmo é uma consulta
+    indexada em vez de uma leitura completa do arquivo.
+
+    A coluna `run_key` (ver run_cache.py) identifica o conteúdo de cada
+    execução e permite reaproveitar resultados já registrados.
+    """
+
+    def __init__(self, path='tuning_results.sqlite'):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+
+        columns = ",\n".join(f"{name} {kind}" for name, kind in result_columns.items())
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY,\n{columns})")
+
+            # Bancos criados por versões anteriores ganham as colunas novas
+            existing = {row['name'] for row in self.connection.execute("PRAGMA table_info(runs)")}
+            for name, kind in result_columns.items():
+                if name not in existing:
+                    self.connection.execute(f"ALTER TABLE runs ADD COLUMN {name} {kind}")
+
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_algorithm_fitness "
+                "ON runs (algorithm, best_fitness)")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_key ON runs (run_key)")
+
+    def add_runs(self, rows):
+        """
+        Insere as execuções em uma única transação. Campos ausentes em uma
+        linha (por exemplo, 'w' em uma execução do GA) ficam NULL.
+        """
+        names = list(result_columns)
+        query = (f"INSERT INTO runs ({', '.join(names)}) "
+                 f"VALUES ({', '.join('?' for _ in names)})")
+        with self.connection:
+            self.connection.executemany(
+                query, ([row.get(name) for name in names] for row in rows))
+
+    def best_run(self, algorithm, objective=None):
+        """
+        Retorna a execução de menor best_fitness do algoritmo (e, se
+        informada, da função objetivo) como dicionário, ou None.
+        """
+        query = "SELECT * FROM runs WHERE algorithm = ?"
+        params = [algorithm]
+        if objective is not None:
+            query += " AND objective = ?"
+            params.append(objective)
+        query += " ORDER BY best_fitness LIMIT 1"
+
+        row = self.connection.execute(query, params).fetchone()
+        return dict(row) if row is not None else None
+
+    def find_runs(self, keys):
+        """
+        Busca execuções pela chave de conteúdo. Retorna um dicionário
+        chave -> execução contendo apenas as chaves encontradas.
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        # Consultas em blocos para respeitar o limite de parâmetros do SQLite
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            query = (f"SELECT * FROM runs WHERE run_key IN ({', '.join('?' for _ in chunk)}) "
+                     f"ORDER BY id")
+            for row in self.connection.execute(query, chunk):
+                found[row['run_key']] = dict(row)
+        return found
+
+    def count(self, algorithm=None):
+        if algorithm is None:
+            return self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM runs WHERE algorithm = ?", (algorithm,)).fetchone()[0]
+
+    def import_csv(self, csv_path, objective='w22'):
+        """
+        Importa um tuning_results.csv legado, convertendo cada coluna para o
+        seu tipo. Campos vazios viram NULL e arquivos antigos, que não
+        registravam a função objetivo, recebem `objective`. Retorna o
+        número de linhas importadas.
+        """
+        rows = []
+        with open(csv_path, mode='r', newline='', encoding='utf-8') as f:
+            for raw in csv.DictReader(f):
+                row = {'objective': objective}
+                for name, kind in result_columns.items():
+                    value = raw.get(name)
+                    if value not in (None, ''):
+                        row[name] = _converters[kind.split()[0]](value)
+                rows.append(row)
+
+        self.add_runs(rows)
+        return len(rows)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
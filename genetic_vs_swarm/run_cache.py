@@ -0,0 +1,71 @@
+import functools
+import hashlib
+import json
+
+import numpy as np
+
+from . import batch_engine as be
+from . import evaluator as ev
+from . import genetic_alg as ga
+from . import objectives as obj
+from . import particle_swarm as ps
+from . import random_streams as rs
+from . import termination as tm
+from . import tuning as ht
+
+
+# Módulos cujo código determina o resultado de uma execução, incluindo a
+# montagem das linhas gravadas no banco (tuning._build_row)
+_versioned_modules = (be, ev, ga, obj, ps, rs, tm, ht)
+
+
+@functools.lru_cache(maxsize=None)
+def code_version():
+    """
+    Hash do código-fonte dos módulos que executam os algoritmos. Qualquer
+    alteração neles muda a versão e, com ela, todas as chaves de execução,
+    invalidando os resultados registrados com o código antigo.
+    """
+    digest = hashlib.sha256()
+    for module in _versioned_modules:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _canonical(value):
+    # Converte valores não serializáveis em JSON para uma forma estável
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if hasattr(value, '__dict__'):
+        # Objetos de configuração (ex.: Termination): apenas os atributos públicos
+        state = {k: v for k, v in vars(value).items() if not k.startswith('_')}
+        return {type(value).__name__: state}
+    raise TypeError(f"Valor sem representação estável para a chave: {value!r}")
+
+
+def run_key(objective, bounds, algorithm, params, seed):
+    """
+    Chave de conteúdo de uma execução: hash de algoritmo, parâmetros,
+    função objetivo, limites, semente e versão do código. Execuções sem
+    semente ou com prazo de relógio (Termination com time_limit) não são
+    reprodutíveis e retornam None (nunca vêm do cache).
+    """
+    if seed is None:
+        return None
+    if any(isinstance(value, tm.Termination) and value.time_limit is not None
+           for value in params.values()):
+        return None
+
+    content = {
+        'algorithm': algorithm,
+        'params': params,
+        'objective': objective,
+        'bounds': bounds,
+        'seed': seed,
+        'code_version': code_version(),
+    }
+    encoded = json.dumps(content, sort_keys=True, default=_canonical)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
@@ -0,0 +1,90 @@
+import numpy as np
+
+
+# Campos de cada registro, na ordem em que são entregues ao sink
+telemetry_dtype = np.dtype([
+    ('generation', np.int64),
+    ('best', np.float64),          # melhor valor da geração/iteração
+    ('best_so_far', np.float64),   # melhor valor desde o início da execução
+    ('mean', np.float64),
+    ('std', np.float64),
+    ('spread', np.float64),        # desvio padrão médio das coordenadas da população
+    ('evaluations', np.int64),
+    ('elapsed_ns', np.int64),      # tempo desde o início da execução
+])
+
+
+def make_record(generation, fitnesses, best_so_far, population, evaluations, elapsed_ns):
+    """
+    Monta o registro (tupla na ordem de telemetry_dtype) de uma geração.
+    """
+    return (generation, float(np.min(fitnesses)), best_so_far,
+            float(np.mean(fitnesses)), float(np.std(fitnesses)),
+            float(np.mean(np.std(population, axis=0))), evaluations, elapsed_ns)
+
+
+class ArrayTelemetry:
+    """
+    Sink que acumula os registros em um array estruturado pré-alocado com
+    `capacity` posições (dobrado se a execução ultrapassar a capacidade).
+    """
+
+    def __init__(self, capacity=1024):
+        self.records = np.zeros(capacity, dtype=telemetry_dtype)
+        self.size = 0
+
+    def __call__(self, record):
+        if self.size == len(self.records):
+            self.records = np.resize(self.records, 2 * len(self.records))
+        self.records[self.size] = record
+        self.size += 1
+
+    def __iter__(self):
+        yield from self.records[:self.size]
+
+    def to_array(self):
+        return self.records[:self.size]
+
+
+class FileTelemetry:
+    """
+    Sink que anexa cada registro, em binário no formato de telemetry_dtype,
+    a um arquivo. O arquivo pode ser lido durante ou depois da execução com
+    read_telemetry ou iter_telemetry.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'ab')
+
+    def __call__(self, record):
+        self._file.write(np.array(record, dtype=telemetry_dtype).tobytes())
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_telemetry(path):
+    return np.fromfile(path, dtype=telemetry_dtype)
+
+
+def iter_telemetry(path, chunk_size=4096):
+    """
+    Gerador que percorre os registros de um arquivo de telemetria em blocos,
+    sem carregá-lo inteiro na memória.
+    """
+    with open(path, 'rb') as f:
+        while True:
+            chunk = np.fromfile(f, dtype=telemetry_dtype, count=chunk_size)
+            if len(chunk) == 0:
+                break
+            yield from chunk
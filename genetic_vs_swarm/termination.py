@@ -0,0 +1,66 @@
+import time
+
+
+class Termination:
+    """
+    Política de parada antecipada compartilhada pelo GA e pelo PSO.
+    Cada critério é opcional (None o desativa) e a execução termina assim
+    que qualquer um deles for atingido:
+
+    - stagnation: gerações/iterações consecutivas sem melhora;
+    - max_evaluations: orçamento de avaliações contadas pelo FunctionEvaluator
+      durante a execução (a próxima geração não é iniciada se estourar o orçamento);
+    - time_limit: prazo de relógio, em segundos;
+    - target_fitness: valor da função considerado suficiente.
+    """
+
+    def __init__(self, stagnation=None, max_evaluations=None, time_limit=None,
+                 target_fitness=None):
+        self.stagnation = stagnation
+        self.max_evaluations = max_evaluations
+        self.time_limit = time_limit
+        self.target_fitness = target_fitness
+
+        self._start_evaluations = 0
+        self._deadline = None
+
+    def start(self, func_evaluator):
+        """
+        Marca o início da execução. O orçamento é relativo às avaliações já
+        registradas no avaliador, que pode ser compartilhado entre execuções.
+        """
+        self._start_evaluations = func_evaluator.evaluations
+        self._deadline = None
+        if self.time_limit is not None:
+            self._deadline = time.perf_counter() + self.time_limit
+
+    def check(self, step, last_improvement, best_fitness, func_evaluator, batch_size):
+        """
+        Retorna o motivo da parada ou None para continuar. `batch_size` é o
+        número de avaliações que a próxima geração/iteração consumiria.
+        """
+        if self.target_fitness is not None and best_fitness <= self.target_fitness:
+            return 'target_fitness'
+
+        if self.stagnation is not None and step - last_improvement > self.stagnation:
+            return 'stagnation'
+
+        if self.check_budget(func_evaluator, batch_size) is not None:
+            return 'max_evaluations'
+
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            return 'time_limit'
+
+        return None
+
+    def check_budget(self, func_evaluator, batch_size):
+        """
+        Retorna 'max_evaluations' se a próxima geração/iteração, com
+        `batch_size` avaliações, estouraria o orçamento; None caso contrário.
+        Usado também antes da primeira geração, quando check ainda não se aplica.
+        """
+        if self.max_evaluations is not None:
+            used = func_evaluator.evaluations - self._start_evaluations
+            if used + batch_size > self.max_evaluations:
+                return 'max_evaluations'
+        return None
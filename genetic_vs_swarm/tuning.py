@@ -0,0 +1,330 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import batch_engine as be
+from . import evaluator as ev
+from . import genetic_alg as ga
+from . import particle_swarm as ps
+from . import random_streams as rs
+from . import results_store as rstore
+from . import run_cache as rc
+
+
+ga_param_space = [
+    # Estratégia: População massiva para máxima diversidade inicial.
+    {'pop_size': 400, 'generations': 75, 'crossover_rate': 0.8, 'mutation_rate': 0.3},
+
+    # Estratégia: Mutação muito alta para forçar a saída de mínimos locais.
+    {'pop_size': 150, 'generations': 200,
+        'crossover_rate': 0.85, 'mutation_rate': 0.5},
+
+    # Estratégia: População grande e mutação alta, um equilíbrio exploratório.
+    {'pop_size': 300, 'generations': 100,
+        'crossover_rate': 0.9, 'mutation_rate': 0.4},
+
+    # Estratégia: "Slow burn" - Crossover mais baixo para preservar boas mutações, com mais tempo para evoluir.
+    {'pop_size': 200, 'generations': 150,
+        'crossover_rate': 0.6, 'mutation_rate': 0.2},
+
+    # Estratégia: Taxa de mutação extremamente alta, quase uma busca aleatória guiada.
+    {'pop_size': 200, 'generations': 150,
+        'crossover_rate': 0.7, 'mutation_rate': 0.7},
+
+    # Estratégia: Variação da população massiva com alta taxa de crossover.
+    {'pop_size': 500, 'generations': 60, 'crossover_rate': 0.9, 'mutation_rate': 0.3},
+
+    # Estratégia: Balanceado, mas com mais gerações e mutação moderada.
+    {'pop_size': 150, 'generations': 200,
+        'crossover_rate': 0.8, 'mutation_rate': 0.25},
+]
+
+pso_param_space = [
+    {'swarm_size': 15, 'iterations': 20, 'w': 0.001, 'c1': 2.0, 'c2': 2.0}, # Inércia quase zero
+    {'swarm_size': 15, 'iterations': 20, 'w': 0.1,   'c1': 2.0, 'c2': 2.0}, # Inércia muito baixa
+    {'swarm_size': 15, 'iterations': 20, 'w': 0.3,   'c1': 2.0, 'c2': 2.0}, # Inércia baixa
+    {'swarm_size': 15, 'iterations': 20, 'w': 0.5,   'c1': 2.0, 'c2': 2.0}, # Inércia moderada
+    {'swarm_size': 15, 'iterations': 20, 'w': 0.7,   'c1': 2.0, 'c2': 2.0}, # Inércia alta (foco em exploração)
+
+    {'swarm_size': 40, 'iterations': 10, 'w': 0.5, 'c1': 2.0, 'c2': 2.0}, # Busca larga e curta
+    {'swarm_size': 20, 'iterations': 20, 'w': 0.5, 'c1': 2.0, 'c2': 2.0}, # Busca balanceada
+    {'swarm_size': 10, 'iterations': 40, 'w': 0.5, 'c1': 2.0, 'c2': 2.0}, # Busca estreita e longa
+    {'swarm_size': 8,  'iterations': 50, 'w': 0.5, 'c1': 2.0, 'c2': 2.0}, # Busca muito estreita e muito longa
+
+    {'swarm_size': 12, 'iterations': 30, 'w': 0.4, 'c1': 2.5, 'c2': 1.5}, # Mais individualista
+    {'swarm_size': 12, 'iterations': 30, 'w': 0.4, 'c1': 1.5, 'c2': 2.5}, # Mais social (convergência rápida)
+]
+
+# --- EXECUÇÃO E COLETA DE DADOS ---
+results_filename = 'tuning_results.sqlite'
+
+OBJECTIVE = 'w22'
+BOUNDS = [-500, 500]
+
+
+def make_instance(algorithm, params, seed):
+    """
+    Cria o GA ou o PSO de uma tarefa, com seu próprio avaliador e seu
+    próprio gerador a partir da semente.
+    """
+    evaluator = ev.FunctionEvaluator(objective_function=OBJECTIVE)
+    if algorithm == 'GA':
+        return ga.GeneticAlgorithm(
+            func_evaluator=evaluator, bounds=BOUNDS, seed=seed, **params)
+    return ps.ParticleSwarmOptimization(
+        func_evaluator=evaluator, bounds=BOUNDS, seed=seed, **params)
+
+
+def instance_row(algorithm, params, seed, instance, execution_time):
+    """
+    Linha de resultados com o estado atual de uma instância de make_instance.
+    """
+    best_fitness = instance.best_fitness if algorithm == 'GA' else instance.gbest_val
+    return _build_row(algorithm, params, seed, best_fitness, instance.global_min_info,
+                      execution_time, instance.func_evaluator.evaluations)
+
+
+def run_configuration(task):
+    """
+    Executa uma única configuração. Cada chamada cria seu próprio avaliador
+    e seu próprio gerador a partir da semente, de modo que o resultado não
+    depende de qual worker executou a tarefa.
+    """
+    algorithm, params, seed = task
+    instance = make_instance(algorithm, params, seed)
+
+    start_time = time.perf_counter()
+    instance.run()
+    end_time = time.perf_counter()
+
+    return instance_row(algorithm, params, seed, instance, end_time - start_time)
+
+
+def _build_row(algorithm, params, seed, best_fitness, global_min_info, execution_time,
+               evaluations):
+    # Coleta de resultados
+    row = {
+        'algorithm': algorithm,
+        'objective': OBJECTIVE,
+        'best_fitness': best_fitness,
+        'execution_time': execution_time,
+        'seed': seed,
+        'evaluations': evaluations
+    }
+
+    # Sem global_min_info, o orçamento não comportou nenhuma geração e as
+    # colunas do mínimo ficam NULL
+    if global_min_info is not None:
+        stats_min, mult_int, div_int = global_min_info
+        row['evaluations_to_find_min'] = stats_min['evaluations']
+        row['total_ops_to_find_min'] = (stats_min['multiplications'] + mult_int +
+                                        stats_min['divisions'] + div_int)
+
+    if algorithm == 'GA':
+        row.update({
+            'pop_or_swarm_size': params['pop_size'], 'gens_or_iterations': params['generations'],
+            'crossover_rate': params['crossover_rate'], 'mutation_rate': params['mutation_rate']
+        })
+    else:
+        row.update({
+            'pop_or_swarm_size': params['swarm_size'], 'gens_or_iterations': params['iterations'],
+            'w': params['w'], 'c1': params['c1'], 'c2': params['c2']
+        })
+
+    return row
+
+
+def run_batched(tasks):
+    """
+    Executa as tarefas de cada algoritmo juntas no motor em lote
+    (batch_engine.py), em um único laço vetorizado no processo atual. Os
+    resultados são idênticos aos de run_configuration; o tempo de execução
+    de cada linha é a média do lote. Não aceita políticas de parada.
+    """
+    rows = [None] * len(tasks)
+    engines = {'GA': be.BatchedGeneticAlgorithm, 'PSO': be.BatchedParticleSwarm}
+
+    for algorithm, engine in engines.items():
+        group = [i for i, task in enumerate(tasks) if task[0] == algorithm]
+        if not group:
+            continue
+
+        start_time = time.perf_counter()
+        batch = engine(OBJECTIVE, [tasks[i][1] for i in group],
+                       seeds=[tasks[i][2] for i in group], bounds=BOUNDS).run()
+        execution_time = (time.perf_counter() - start_time) / len(group)
+
+        for i, result in zip(group, batch.results()):
+            rows[i] = batch_row(*tasks[i], result, execution_time)
+    return rows
+
+
+def batch_row(algorithm, params, seed, result, execution_time):
+    """
+    Linha de resultados de uma execução do motor em lote, a partir da
+    entrada correspondente de results().
+    """
+    best_fitness = result['best_fitness' if algorithm == 'GA' else 'gbest_val']
+    return _build_row(algorithm, params, seed, best_fitness, result['global_min_info'],
+                      execution_time, result['evaluations'])
+
+
+def build_tasks(repeats=1, seed=None, termination=None):
+    """
+    Monta a lista ordenada de tarefas (algoritmo, parâmetros, semente).
+    As sementes são derivadas de uma SeedSequence, gerando fluxos
+    independentes para cada repetição. Uma política `termination`, se
+    fornecida, é aplicada a todas as execuções.
+    """
+    configs = [('GA', params) for params in ga_param_space]
+    configs += [('PSO', params) for params in pso_param_space]
+    if termination is not None:
+        configs = [(algorithm, dict(params, termination=termination))
+                   for algorithm, params in configs]
+
+    seeds = iter(rs.spawn_seeds(seed, len(configs) * repeats))
+    return [(algorithm, params, next(seeds))
+            for algorithm, params in configs for _ in range(repeats)]
+
+
+def grid_evaluations(repeats=1):
+    """
+    Orçamento de avaliações da grade fixa (população x gerações ou enxame x
+    iterações de cada configuração), sem parada antecipada.
+    """
+    total = sum(p['pop_size'] * p['generations'] for p in ga_param_space)
+    total += sum(p['swarm_size'] * p['iterations'] for p in pso_param_space)
+    return total * repeats
+
+
+def _execute_tasks(tasks, workers=None, batched=False):
+    if batched:
+        return run_batched(tasks)
+
+    # executor.map preserva a ordem de submissão
+    if workers == 1:
+        return [run_configuration(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_configuration, tasks))
+
+
+def run_sweep(tasks, workers=None, store=None, reuse=True, batched=False):
+    """
+    Distribui as tarefas em um pool de processos. executor.map preserva a
+    ordem de submissão, então os resultados voltam em ordem determinística.
+    Com `batched`, as tarefas são executadas juntas por run_batched.
+
+    Com um ResultsStore em `store`, cada tarefa recebe uma chave de conteúdo
+    (run_cache.run_key): execuções já registradas com a mesma chave são lidas
+    do banco em vez de recalculadas, tarefas repetidas na própria varredura
+    são executadas uma única vez e as execuções novas são gravadas no banco.
+    Linhas reaproveitadas são marcadas com 'cached'. Com `reuse=False` o
+    banco não é consultado, mas as execuções continuam sendo gravadas.
+    """
+    if store is None:
+        return _execute_tasks(tasks, workers, batched)
+
+    keys = [rc.run_key(OBJECTIVE, BOUNDS, *task) for task in tasks]
+    cached = {}
+    if reuse:
+        cached = store.find_runs(key for key in keys if key is not None)
+
+    rows = [None] * len(tasks)
+    first = {}     # chave -> primeira tarefa da varredura com essa chave
+    pending = []
+    for i, key in enumerate(keys):
+        if key in cached:
+            rows[i] = dict(cached[key], cached=True)
+        elif key is None or key not in first:
+            first[key] = i
+            pending.append(i)
+
+    new_rows = _execute_tasks([tasks[i] for i in pending], workers, batched)
+    for i, row in zip(pending, new_rows):
+        row['run_key'] = keys[i]
+        rows[i] = row
+    store.add_runs(new_rows)
+
+    for i, key in enumerate(keys):
+        if rows[i] is None:
+            rows[i] = dict(rows[first[key]], cached=True)
+    return rows
+
+
+def report_best(filename=results_filename):
+    print("\n--- ANÁLISE DOS MELHORES RESULTADOS ---")
+    with rstore.ResultsStore(filename) as store:
+        best_ga_run = store.best_run('GA')
+        best_pso_run = store.best_run('PSO')
+
+    if best_ga_run:
+        print("\nMelhor Configuração encontrada para o Algoritmo Genético:")
+        print(f"  - Fitness: {best_ga_run['best_fitness']:.4f}")
+        print(f"  - Parâmetros: pop_size={best_ga_run['pop_or_swarm_size']}, "
+              f"generations={best_ga_run['gens_or_iterations']}, "
+              f"crossover_rate={best_ga_run['crossover_rate']}, "
+              f"mutation_rate={best_ga_run['mutation_rate']}")
+        print(f"  - Custo: {best_ga_run['total_ops_to_find_min']} operações em "
+              f"{best_ga_run['execution_time']:.2f}s")
+
+    if best_pso_run:
+        print("\nMelhor Configuração encontrada para o Enxame de Partículas:")
+        print(f"  - Fitness: {best_pso_run['best_fitness']:.4f}")
+        print(f"  - Parâmetros: swarm_size={best_pso_run['pop_or_swarm_size']}, "
+              f"iterations={best_pso_run['gens_or_iterations']}, "
+              f"w={best_pso_run['w']}, c1={best_pso_run['c1']}, c2={best_pso_run['c2']}")
+        print(f"  - Custo: {best_pso_run['total_ops_to_find_min']} operações em "
+              f"{best_pso_run['execution_time']:.2f}s")
+
+
+def import_csv(csv_path, filename=results_filename):
+    """
+    Importa um tuning_results.csv legado para o banco de resultados.
+    """
+    with rstore.ResultsStore(filename) as store:
+        imported = store.import_csv(csv_path)
+    print(f"{imported} execuções importadas de '{csv_path}' para '{filename}'.")
+    report_best(filename)
+
+
+def tune(repeats=1, seed=None, workers=None, termination=None, adaptive=False,
+         batched=False, reuse=True, filename=results_filename):
+    """
+    Executa a varredura da grade fixa (ou, com `adaptive`, a busca por
+    successive halving de adaptive_tuning.py), grava as execuções no banco
+    `filename` e exibe as melhores configurações. A busca adaptativa não
+    reaproveita execuções do banco (`reuse` vale apenas para a grade).
+    """
+    store = rstore.ResultsStore(filename)
+
+    if adaptive:
+        from . import adaptive_tuning as at
+
+        rows = []
+        evaluations = 0
+        for algorithm in ('GA', 'PSO'):
+            print(f"--- BUSCA ADAPTATIVA: {algorithm} ---")
+            result = at.successive_halving(algorithm, repeats=repeats, seed=seed,
+                                           workers=workers, termination=termination,
+                                           store=store, batched=batched)
+            at.print_history(result)
+            rows += result['rows']
+            evaluations += result['evaluations']
+        store.close()
+
+        print(f"Total de avaliações da busca adaptativa: {evaluations} "
+              f"(orçamento da grade fixa: {grid_evaluations(repeats)})")
+    else:
+        tasks = build_tasks(repeats=repeats, seed=seed, termination=termination)
+        print(f"--- INICIANDO VARREDURA: {len(tasks)} execuções ---")
+        rows = run_sweep(tasks, workers=workers, store=store, reuse=reuse, batched=batched)
+        store.close()
+
+        executed = [row for row in rows if not row.get('cached')]
+        print(f"{len(executed)} execuções novas, {len(rows) - len(executed)} reaproveitadas do banco")
+        print(f"Total de avaliações: {sum(row['evaluations'] for row in executed)}")
+
+    print(f"\n--- TESTES CONCLUÍDOS. Resultados salvos em '{filename}' ---")
+
+    report_best(filename)
+    return rows